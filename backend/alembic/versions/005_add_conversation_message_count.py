@@ -0,0 +1,60 @@
+"""添加对话消息计数列
+
+Revision ID: 005_message_count
+Revises: 004_favorites
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_message_count'
+down_revision: Union[str, None] = '004_favorites'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 添加消息计数列
+    op.add_column(
+        'conversations',
+        sa.Column('message_count', sa.Integer(), server_default='0', nullable=False, comment='消息数量')
+    )
+    
+    # 回填已有对话的消息数量
+    op.execute("""
+        UPDATE conversations c
+        SET message_count = (SELECT count(*) FROM messages m WHERE m.conversation_id = c.id)
+    """)
+    
+    # 触发器：插入/删除消息时维护计数
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_conversation_message_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE conversations SET message_count = message_count + 1
+                WHERE id = NEW.conversation_id;
+                RETURN NEW;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE conversations SET message_count = message_count - 1
+                WHERE id = OLD.conversation_id;
+                RETURN OLD;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_messages_count
+        AFTER INSERT OR DELETE ON messages
+        FOR EACH ROW EXECUTE FUNCTION update_conversation_message_count()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_messages_count ON messages")
+    op.execute("DROP FUNCTION IF EXISTS update_conversation_message_count()")
+    op.drop_column('conversations', 'message_count')
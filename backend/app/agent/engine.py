@@ -5,6 +5,7 @@ Agent 引擎核心
 """
 import asyncio
 import json
+import logging
 from typing import AsyncGenerator
 from dataclasses import dataclass, field
 
@@ -638,13 +639,15 @@ class AgentEngine:
         full_content = ""
         sent_content = ""  # 已发送的内容
         chunk_count = 0  # 调试用：统计发送的块数
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)  # 循环外判断一次，关闭时跳过字符串格式化
         
         async for delta in content_gen:
             if delta:
                 full_content += delta
                 chunk_count += 1
                 # 实时发送内容增量
-                logger.debug(f"发送 content_delta #{chunk_count}: {delta[:20]}...")
+                if debug_enabled:
+                    logger.debug(f"发送 content_delta #{chunk_count}: {delta[:20]}...")
                 yield {
                     "type": "content_delta",
                     "role": role.id,
@@ -783,11 +786,13 @@ class AgentEngine:
         # 真正的流式输出：边接收边发送
         full_content = ""
         tool_chunk_count = 0  # 调试用
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         async for delta in content_gen:
             if delta:
                 full_content += delta
                 tool_chunk_count += 1
-                logger.debug(f"工具调用后 content_delta #{tool_chunk_count}: {delta[:20]}...")
+                if debug_enabled:
+                    logger.debug(f"工具调用后 content_delta #{tool_chunk_count}: {delta[:20]}...")
                 # 实时发送内容增量
                 yield {
                     "type": "content_delta",
@@ -5,10 +5,12 @@
 import json
 import re
 from dataclasses import dataclass, field
+from functools import cache
 
 from app.agent.roles import (
     Role,
     PURCHASE_CONSULTANT,
+    get_all_roles,
     get_specialist_roles,
     get_role
 )
@@ -18,6 +20,58 @@ from app.utils.logger import get_logger
 logger = get_logger("house_advisor.agent.intent")
 
 
+def _compile_keyword_matcher(
+    roles: list[Role]
+) -> tuple[re.Pattern | None, dict[str, int]]:
+    """
+    将所有角色的触发关键词编译为一个正则，扫描一遍文本即可得到全部命中角色
+    
+    关键词按长度降序放入零宽前瞻 (?=(...))，每个起始位置取最长的命中关键词；
+    同一位置能命中的更短关键词必然是它的前缀，因此预先把前缀关键词对应的角色并入，
+    避免"公积金贷款"与"贷款"这类重叠关键词漏掉角色
+    
+    关键词在构建时统一转为小写，正则以 IGNORECASE 编译：匹配时不必复制整段文本做 lower()，
+    只对命中的关键词片段转小写后查表
+    
+    命中角色用位掩码表示（第 i 位对应第 i 个角色），扫描时按位或累加
+    
+    Returns:
+        (关键词正则, 关键词 -> 命中角色位掩码)；没有任何关键词时正则为 None
+    """
+    keyword_roles: dict[str, int] = {}
+    for index, role in enumerate(roles):
+        for keyword in role.trigger_keywords:
+            if keyword:
+                keyword = keyword.lower()
+                keyword_roles[keyword] = keyword_roles.get(keyword, 0) | (1 << index)
+    
+    if not keyword_roles:
+        return None, {}
+    
+    hit_roles = {}
+    for keyword in keyword_roles:
+        mask = 0
+        for prefix, prefix_mask in keyword_roles.items():
+            if keyword.startswith(prefix):
+                mask |= prefix_mask
+        hit_roles[keyword] = mask
+    keywords = sorted(keyword_roles, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))", re.IGNORECASE)
+    return pattern, hit_roles
+
+
+@cache
+def _get_keyword_matcher() -> tuple[tuple[Role, ...], re.Pattern | None, dict[str, int]]:
+    """
+    获取角色关键词匹配器（进程内只构建一次，所有 IntentRecognizer 实例共享）
+    
+    Returns:
+        (角色元组, 关键词正则, 关键词 -> 命中角色位掩码)
+    """
+    roles = tuple(get_all_roles())
+    return (roles, *_compile_keyword_matcher(list(roles)))
+
+
 @dataclass
 class ExecutionNode:
     """
@@ -219,6 +273,7 @@ class IntentRecognizer:
             llm_client: LLM 客户端
         """
         self._llm_client = llm_client
+        self._keyword_roles, self._keyword_pattern, self._keyword_hits = _get_keyword_matcher()
     
     @property
     def llm_client(self) -> DeepSeekClient:
@@ -227,6 +282,29 @@ class IntentRecognizer:
             self._llm_client = DeepSeekClient()
         return self._llm_client
     
+    def match_keywords(self, text: str) -> list[Role]:
+        """
+        根据触发关键词匹配角色（不调用 LLM）
+        
+        所有角色的关键词已预编译为一个正则，只需扫描一次文本（不区分大小写），
+        所有角色都已命中时提前结束扫描
+        
+        Args:
+            text: 用户输入文本
+            
+        Returns:
+            命中的角色列表（按角色定义顺序）
+        """
+        if self._keyword_pattern is None:
+            return []
+        all_mask = (1 << len(self._keyword_roles)) - 1
+        mask = 0
+        for match in self._keyword_pattern.finditer(text):
+            mask |= self._keyword_hits[match.group(1).lower()]
+            if mask == all_mask:
+                break
+        return [role for index, role in enumerate(self._keyword_roles) if mask >> index & 1]
+    
     async def plan_execution(self, user_input: str) -> ExecutionPlan:
         """
         分析用户输入，生成 DAG 执行计划
@@ -97,9 +97,16 @@ class BaseTool(ABC):
         """
         转换为 OpenAI 函数调用格式
         
+        工具定义在实例创建后不再变化，schema 只在首次调用时构建并缓存在实例上
+        （每轮对话都会通过 get_schemas 取用），调用方不应修改返回的字典
+        
         Returns:
             符合 OpenAI function calling 格式的字典
         """
+        schema = self.__dict__.get("_openai_schema")
+        if schema is not None:
+            return schema
+        
         # 构建 parameters schema
         properties = {}
         required = []
@@ -109,7 +116,7 @@ class BaseTool(ABC):
             if param.required:
                 required.append(param.name)
         
-        return {
+        schema = {
             "type": "function",
             "function": {
                 "name": self.name,
@@ -121,3 +128,5 @@ class BaseTool(ABC):
                 }
             }
         }
+        self._openai_schema = schema
+        return schema
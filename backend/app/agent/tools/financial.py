@@ -1,11 +1,38 @@
 # 财务计算工具
 # 包含贷款计算、税费计算、总成本计算、还款压力评估
 
+import math
+
 from app.agent.tools.base import BaseTool, ToolParameter
 from app.agent.tools.registry import register_tool
 from app.data.loader import get_data_loader
 
 
+def _equal_payment(loan_amount: float, monthly_rate: float, months: int) -> tuple[float, float]:
+    """
+    等额本息核心计算（纯函数，贷款计算和还款计划共用）
+    
+    月供 = P × r × (1+r)^n / ((1+r)^n - 1)，零利率或极小利率按无息贷款处理
+    
+    (1+r)^n - 1 用 expm1(n × log1p(r)) 直接求得，避免先算 (1+r)^n 再减 1 的精度损失
+    
+    Returns:
+        (月供, 还款总额)
+    """
+    # 当利率极小时，(1+r)^n - 1 ≈ 0
+    if monthly_rate < 1e-10:
+        return loan_amount / months, loan_amount
+    
+    growth = math.expm1(months * math.log1p(monthly_rate))  # (1+r)^n - 1
+    
+    # 再次检查 growth 是否接近零（防止浮点精度问题）
+    if abs(growth) < 1e-10:
+        return loan_amount / months, loan_amount
+    
+    monthly_payment = loan_amount * monthly_rate * (growth + 1) / growth
+    return monthly_payment, monthly_payment * months
+
+
 @register_tool
 class CalcLoanTool(BaseTool):
     """贷款计算工具"""
@@ -43,6 +70,10 @@ class CalcLoanTool(BaseTool):
     ]
     
     async def execute(self, **kwargs) -> dict:
+        """异步入口（供 Agent 调用）：纯计算无 I/O，直接委托给 execute_sync"""
+        return self.execute_sync(**kwargs)
+    
+    def execute_sync(self, **kwargs) -> dict:
         """
         执行贷款计算
         
@@ -58,12 +89,28 @@ class CalcLoanTool(BaseTool):
         """
         self.validate_params(**kwargs)
         
-        price = kwargs["price"]
-        down_payment_ratio = kwargs["down_payment_ratio"]
-        years = kwargs["years"]
-        rate = kwargs["rate"]
-        method = kwargs.get("method", "equal_payment")
+        return self.execute_validated(
+            price=kwargs["price"],
+            down_payment_ratio=kwargs["down_payment_ratio"],
+            years=kwargs["years"],
+            rate=kwargs["rate"],
+            method=kwargs.get("method", "equal_payment")
+        )
+    
+    def execute_validated(
+        self,
+        *,
+        price: float,
+        down_payment_ratio: float,
+        years: int,
+        rate: float,
+        method: str = "equal_payment"
+    ) -> dict:
+        """
+        执行贷款计算（参数已校验）
         
+        跳过通用参数校验，供已知参数合法的调用方（如批量计算、属性测试）直接使用
+        """
         # 计算基础数据
         down_payment = price * down_payment_ratio  # 首付金额
         loan_amount = price - down_payment  # 贷款金额
@@ -94,32 +141,7 @@ class CalcLoanTool(BaseTool):
         等额本息计算
         月供固定，前期利息多本金少，后期本金多利息少
         """
-        # 处理零利率或极小利率情况（避免除零错误）
-        # 当利率极小时，(1+r)^n ≈ 1，导致 power - 1 ≈ 0
-        if monthly_rate < 1e-10:
-            # 零利率或极小利率情况，按无息贷款处理
-            monthly_payment = loan_amount / months
-            return {
-                "monthly_payment": monthly_payment,
-                "total_payment": loan_amount,
-                "total_interest": 0
-            }
-        
-        # 月供 = P × r × (1+r)^n / ((1+r)^n - 1)
-        # P = 贷款金额, r = 月利率, n = 月数
-        power = (1 + monthly_rate) ** months
-        
-        # 再次检查 power - 1 是否接近零（防止浮点精度问题）
-        if abs(power - 1) < 1e-10:
-            monthly_payment = loan_amount / months
-            return {
-                "monthly_payment": monthly_payment,
-                "total_payment": loan_amount,
-                "total_interest": 0
-            }
-        
-        monthly_payment = loan_amount * monthly_rate * power / (power - 1)
-        total_payment = monthly_payment * months
+        monthly_payment, total_payment = _equal_payment(loan_amount, monthly_rate, months)
         total_interest = total_payment - loan_amount
         
         return {
@@ -195,6 +217,10 @@ class CalcTaxTool(BaseTool):
     ]
     
     async def execute(self, **kwargs) -> dict:
+        """异步入口（供 Agent 调用）：纯计算无 I/O，直接委托给 execute_sync"""
+        return self.execute_sync(**kwargs)
+    
+    def execute_sync(self, **kwargs) -> dict:
         """
         执行税费计算
         
@@ -220,7 +246,8 @@ class CalcTaxTool(BaseTool):
         tax_rules = get_data_loader().tax_rules
         
         # 1. 契税计算
-        deed_tax = self._calc_deed_tax(price, area, is_first_home, tax_rules.deed_tax)
+        deed_tax_rate = self._get_deed_tax_rate(area, is_first_home, tax_rules.deed_tax)
+        deed_tax = price * deed_tax_rate
         
         # 2. 增值税计算（满 2 年免征）
         vat = self._calc_vat(price, original_price, house_age_years, tax_rules.vat)
@@ -238,7 +265,7 @@ class CalcTaxTool(BaseTool):
         
         return {
             "deed_tax": round(deed_tax, 2),
-            "deed_tax_rate": self._get_deed_tax_rate(area, is_first_home, tax_rules.deed_tax),
+            "deed_tax_rate": deed_tax_rate,
             "vat": round(vat, 2),
             "vat_exempt": house_age_years >= 2,
             "income_tax": round(income_tax, 2),
@@ -249,30 +276,14 @@ class CalcTaxTool(BaseTool):
         }
     
     def _get_deed_tax_rate(self, area: float, is_first_home: bool, deed_tax_config) -> float:
-        """获取契税税率（从配置读取）"""
-        if is_first_home:
-            # 首套房
-            if area <= 90:
-                return deed_tax_config.first_home_below_90
-            else:
-                return deed_tax_config.first_home_above_90
-        else:
-            # 二套房
-            if area <= 90:
-                return deed_tax_config.second_home_below_90
-            else:
-                return deed_tax_config.second_home_above_90
-    
-    def _calc_deed_tax(self, price: float, area: float, is_first_home: bool, deed_tax_config) -> float:
         """
-        计算契税（从配置读取税率）
+        获取契税税率（从配置读取，查表代替分支判断）
         - 首套且面积≤90㎡：1%
         - 首套且面积>90㎡：1.5%
         - 二套且面积≤90㎡：1%
         - 二套且面积>90㎡：2%
         """
-        rate = self._get_deed_tax_rate(area, is_first_home, deed_tax_config)
-        return price * rate
+        return deed_tax_config.rate_table[int(is_first_home)][int(area > 90)]
     
     def _calc_vat(self, price: float, original_price: float, house_age_years: int, vat_config) -> float:
         """
@@ -366,6 +377,10 @@ class CalcTotalCostTool(BaseTool):
     ]
     
     async def execute(self, **kwargs) -> dict:
+        """异步入口（供 Agent 调用）：纯计算无 I/O，直接委托给 execute_sync"""
+        return self.execute_sync(**kwargs)
+    
+    def execute_sync(self, **kwargs) -> dict:
         """
         执行总成本计算
         
@@ -406,11 +421,11 @@ class CalcTotalCostTool(BaseTool):
             "其他费用": other_fees
         }
         
-        # 初期投入（需要立即支付的）
-        initial_cost = down_payment + taxes + decoration + furniture + other_fees
+        # 初期投入（需要立即支付的），fsum 精确求和避免逐项累加的舍入误差
+        initial_cost = math.fsum((down_payment, taxes, decoration, furniture, other_fees))
         
         # 总成本（含贷款利息）
-        total_cost = price + total_interest + taxes + decoration + furniture + other_fees
+        total_cost = math.fsum((price, total_interest, taxes, decoration, furniture, other_fees))
         
         # 成本明细
         breakdown = [
@@ -477,6 +492,10 @@ class GenerateRepaymentPlanTool(BaseTool):
     ]
     
     async def execute(self, **kwargs) -> dict:
+        """异步入口（供 Agent 调用）：纯计算无 I/O，直接委托给 execute_sync"""
+        return self.execute_sync(**kwargs)
+    
+    def execute_sync(self, **kwargs) -> dict:
         """
         生成还款计划
         
@@ -557,8 +576,7 @@ class GenerateRepaymentPlanTool(BaseTool):
             return schedule
         
         # 计算月供
-        power = (1 + monthly_rate) ** months
-        monthly_payment = loan_amount * monthly_rate * power / (power - 1)
+        monthly_payment, _ = _equal_payment(loan_amount, monthly_rate, months)
         
         remaining = loan_amount
         for period in range(1, months + 1):
@@ -658,6 +676,10 @@ class AssessPressureTool(BaseTool):
     ]
     
     async def execute(self, **kwargs) -> dict:
+        """异步入口（供 Agent 调用）：纯计算无 I/O，直接委托给 execute_sync"""
+        return self.execute_sync(**kwargs)
+    
+    def execute_sync(self, **kwargs) -> dict:
         """
         执行还款压力评估
         
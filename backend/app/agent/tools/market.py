@@ -321,29 +321,30 @@ class CompareDistrictsTool(BaseTool):
                 "error": f"暂不支持 {city} 的数据查询"
             }
         
-        # 收集各区域数据
+        # 收集各区域数据（直接读取已加载的模型字段，不逐个区域 model_dump）
+        district_map = market_data.districts
         comparison = []
         not_found = []
         
         for district in districts:
-            data = get_district_data(city, district)
+            data = district_map.get(district)
             if data:
                 comparison.append({
                     "district": district,
-                    "avg_price": data["avg_price"],
-                    "price_range": data["price_range"],
-                    "monthly_sales": data["monthly_sales"],
-                    "inventory": data["inventory"],
-                    "inventory_months": data["inventory_months"],
-                    "yoy_change": data["yoy_change"],
-                    "hot_level": data["hot_level"],
-                    "description": data["description"]
+                    "avg_price": data.avg_price,
+                    "price_range": data.price_range,
+                    "monthly_sales": data.monthly_sales,
+                    "inventory": data.inventory,
+                    "inventory_months": data.inventory_months,
+                    "yoy_change": data.yoy_change,
+                    "hot_level": data.hot_level,
+                    "description": data.description
                 })
             else:
                 not_found.append(district)
         
         if not comparison:
-            available = get_city_districts(city)
+            available = list(district_map)
             return {
                 "success": False,
                 "error": f"未找到有效区域数据，可选区域：{', '.join(available)}"
@@ -351,6 +352,7 @@ class CompareDistrictsTool(BaseTool):
         
         # 计算对比指标
         prices = [d["avg_price"] for d in comparison]
+        mean_price = sum(prices) / len(prices)
         cheapest = min(comparison, key=lambda x: x["avg_price"])
         most_expensive = max(comparison, key=lambda x: x["avg_price"])
         hottest = max(comparison, key=lambda x: x["monthly_sales"])
@@ -360,7 +362,7 @@ class CompareDistrictsTool(BaseTool):
         
         # 性价比推荐（价格低但成交活跃）
         for d in comparison:
-            if d["avg_price"] <= sum(prices) / len(prices) and d["hot_level"] in ["中", "高"]:
+            if d["avg_price"] <= mean_price and d["hot_level"] in ("中", "高"):
                 recommendations.append({
                     "district": d["district"],
                     "reason": "性价比高",
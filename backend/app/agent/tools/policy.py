@@ -2,10 +2,12 @@
 # 使用 Chroma 向量数据库实现 RAG 检索
 # 支持 Redis 缓存加速
 
-import json
+import heapq
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from app.agent.tools.base import BaseTool, ToolParameter
 from app.agent.tools.registry import register_tool
 from app.config.settings import get_settings
@@ -18,6 +20,49 @@ logger = get_logger(__name__)
 KNOWLEDGE_BASE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "knowledge"
 
 
+def _build_city_index(docs: list[dict]) -> dict[str | None, list[dict]]:
+    """
+    按城市预先分桶
+    
+    每个城市对应"该城市文档 + 不限城市的通用文档"（保持原顺序），
+    None 对应仅通用文档（用于未知城市）
+    """
+    cities = {doc["city"] for doc in docs if doc.get("city")}
+    index: dict[str | None, list[dict]] = {
+        city: [doc for doc in docs if not doc.get("city") or doc["city"] == city]
+        for city in cities
+    }
+    index[None] = [doc for doc in docs if not doc.get("city")]
+    return index
+
+
+def _prepare_search_fields(doc: dict) -> None:
+    """
+    预先计算关键词检索用的小写字段（以下划线开头，不出现在检索结果中）
+    
+    检索时每条文档每次查询都要对全文 lower()，长文档的开销远大于打分本身，
+    加载时算一次即可
+    """
+    keywords = doc.get("keywords", [])
+    if isinstance(keywords, str):
+        keywords = keywords.split(",")
+    doc["_content_lower"] = (doc.get("content", "") or doc.get("answer", "")).lower()
+    doc["_title_lower"] = (doc.get("title", "") or doc.get("question", "")).lower()
+    doc["_question_lower"] = doc.get("question", "").lower()
+    doc["_answer_lower"] = doc.get("answer", "").lower()
+    doc["_keywords_lower"] = [kw.lower() for kw in keywords]
+
+
+def _top_scored(scored: list[tuple[int, dict]], top_k: int) -> list[tuple[int, dict]]:
+    """
+    从 (得分, 文档) 中取前 top_k 条
+    
+    relevance_score 在得分 10 处封顶，按封顶后的得分取；heapq.nlargest 对同分保持原顺序，
+    结果与整表排序后截断一致，但只需为入选的文档构造结果字典
+    """
+    return heapq.nlargest(top_k, scored, key=lambda item: min(item[0], 10))
+
+
 class PolicyKnowledgeBase:
     """
     政策知识库管理类
@@ -42,6 +87,8 @@ class PolicyKnowledgeBase:
         self._policies: list[dict] = []
         self._faqs: list[dict] = []
         self._guides: list[dict] = []
+        self._policies_by_city: dict[str | None, list[dict]] = {}
+        self._faqs_by_city: dict[str | None, list[dict]] = {}
         self._chroma_client = None
         self._use_vector_search = False
         
@@ -78,13 +125,12 @@ class PolicyKnowledgeBase:
         # 加载 FAQ
         faq_file = KNOWLEDGE_BASE_DIR / "faq" / "faq.json"
         if faq_file.exists():
-            with open(faq_file, "r", encoding="utf-8") as f:
-                faqs = json.load(f)
-                for faq in faqs:
-                    faq["type"] = "faq"
-                    faq["id"] = faq.get("faq_id", f"faq_{len(self._faqs)}")
-                self._faqs = faqs
-                logger.info(f"加载 FAQ: {len(faqs)} 条")
+            faqs = orjson.loads(faq_file.read_bytes())
+            for faq in faqs:
+                faq["type"] = "faq"
+                faq["id"] = faq.get("faq_id", f"faq_{len(self._faqs)}")
+            self._faqs = faqs
+            logger.info(f"加载 FAQ: {len(faqs)} 条")
         
         # 加载购房指南
         guides_dir = KNOWLEDGE_BASE_DIR / "guides"
@@ -102,6 +148,13 @@ class PolicyKnowledgeBase:
                 }
                 self._guides.append(guide_doc)
                 logger.info(f"加载购房指南: {guide_file.name}")
+        
+        for doc in (*self._policies, *self._faqs, *self._guides):
+            _prepare_search_fields(doc)
+        
+        # 城市过滤索引（检索时直接取对应城市的文档列表，无需逐条过滤）
+        self._policies_by_city = _build_city_index(self._policies)
+        self._faqs_by_city = _build_city_index(self._faqs)
     
     def _extract_city_from_filename(self, filename: str) -> str | None:
         """从文件名提取城市"""
@@ -303,19 +356,15 @@ class PolicyKnowledgeBase:
         top_k: int
     ) -> list[dict]:
         """使用关键词匹配（降级方案）"""
-        results = []
+        scored = []
         
-        # 选择数据源
+        # 选择数据源（带城市时使用预建的城市索引）
         if doc_type == "policy":
-            docs = self._policies
+            docs = self._policies_by_city.get(city, self._policies_by_city[None]) if city else self._policies
         elif doc_type == "guide":
             docs = self._guides
         else:
-            docs = self._faqs
-        
-        # 城市过滤
-        if city:
-            docs = [d for d in docs if d.get("city") == city or d.get("city") is None]
+            docs = self._faqs_by_city.get(city, self._faqs_by_city[None]) if city else self._faqs
         
         # 关键词匹配评分
         query_lower = query.lower()
@@ -325,42 +374,41 @@ class PolicyKnowledgeBase:
             score = 0
             
             # 检查内容匹配
-            content = doc.get("content", "") or doc.get("answer", "")
-            content_lower = content.lower()
-            
+            content_lower = doc["_content_lower"]
             for term in query_terms:
                 if term in content_lower:
                     score += 1
             
             # 检查关键词匹配
-            keywords = doc.get("keywords", [])
-            if isinstance(keywords, str):
-                keywords = keywords.split(",")
-            
-            for kw in keywords:
-                if kw.lower() in query_lower or query_lower in kw.lower():
+            for kw in doc["_keywords_lower"]:
+                if kw in query_lower or query_lower in kw:
                     score += 2  # 关键词匹配权重更高
             
             # 检查标题/问题匹配
-            title = doc.get("title", "") or doc.get("question", "")
-            if query_lower in title.lower():
+            if query_lower in doc["_title_lower"]:
                 score += 3
             
             if score > 0:
-                results.append({
-                    "id": doc.get("id", ""),
-                    "content": content[:500] + "..." if len(content) > 500 else content,
-                    "relevance_score": min(score / 10, 1.0),
-                    "type": doc_type,
-                    "city": doc.get("city"),
-                    "title": doc.get("title") or doc.get("question"),
-                    "category": doc.get("category"),
-                    "keywords": keywords
-                })
-        
-        # 按分数排序
-        results.sort(key=lambda x: x["relevance_score"], reverse=True)
-        return results[:top_k]
+                scored.append((score, doc))
+        
+        # 按分数取前 top_k 条，仅为入选文档构造结果
+        results = []
+        for score, doc in _top_scored(scored, top_k):
+            content = doc.get("content", "") or doc.get("answer", "")
+            keywords = doc.get("keywords", [])
+            if isinstance(keywords, str):
+                keywords = keywords.split(",")
+            results.append({
+                "id": doc.get("id", ""),
+                "content": content[:500] + "..." if len(content) > 500 else content,
+                "relevance_score": min(score / 10, 1.0),
+                "type": doc_type,
+                "city": doc.get("city"),
+                "title": doc.get("title") or doc.get("question"),
+                "category": doc.get("category"),
+                "keywords": keywords
+            })
+        return results
     
     def _keyword_search_faq(
         self,
@@ -370,15 +418,14 @@ class PolicyKnowledgeBase:
         top_k: int
     ) -> list[dict]:
         """FAQ 关键词搜索"""
-        results = []
+        scored = []
         query_lower = query.lower()
         query_terms = query_lower.split()
         
-        for faq in self._faqs:
-            # 城市过滤
-            if city and faq.get("city") and faq["city"] != city:
-                continue
-            
+        # 城市过滤（预建的城市索引）
+        faqs = self._faqs_by_city.get(city, self._faqs_by_city[None]) if city else self._faqs
+        
+        for faq in faqs:
             # 分类过滤
             if category and faq.get("category") != category:
                 continue
@@ -386,36 +433,37 @@ class PolicyKnowledgeBase:
             score = 0
             
             # 问题匹配
-            question = faq.get("question", "").lower()
+            question = faq["_question_lower"]
             for term in query_terms:
                 if term in question:
                     score += 2
             
             # 答案匹配
-            answer = faq.get("answer", "").lower()
+            answer = faq["_answer_lower"]
             for term in query_terms:
                 if term in answer:
                     score += 1
             
             # 关键词匹配
-            keywords = faq.get("keywords", [])
-            for kw in keywords:
-                if kw.lower() in query_lower:
+            for kw in faq["_keywords_lower"]:
+                if kw in query_lower:
                     score += 3
             
             if score > 0:
-                results.append({
-                    "id": faq.get("faq_id", ""),
-                    "question": faq.get("question", ""),
-                    "answer": faq.get("answer", ""),
-                    "category": faq.get("category", ""),
-                    "city": faq.get("city"),
-                    "relevance_score": min(score / 10, 1.0),
-                    "keywords": keywords
-                })
-        
-        results.sort(key=lambda x: x["relevance_score"], reverse=True)
-        return results[:top_k]
+                scored.append((score, faq))
+        
+        return [
+            {
+                "id": faq.get("faq_id", ""),
+                "question": faq.get("question", ""),
+                "answer": faq.get("answer", ""),
+                "category": faq.get("category", ""),
+                "city": faq.get("city"),
+                "relevance_score": min(score / 10, 1.0),
+                "keywords": faq.get("keywords", [])
+            }
+            for score, faq in _top_scored(scored, top_k)
+        ]
 
 
 # 全局知识库实例
@@ -70,7 +70,7 @@ class ToolRegistry:
             OpenAI function schema 列表
         """
         if names is None:
-            tools = self.get_all()
+            tools = self._tools.values()
         else:
             tools = self.get_by_names(names)
         return [tool.to_openai_schema() for tool in tools]
@@ -87,6 +87,14 @@ class ToolRegistry:
         """
         return name in self._tools
     
+    def __contains__(self, name: str) -> bool:
+        """支持 name in tool_registry"""
+        return name in self._tools
+    
+    def __len__(self) -> int:
+        """已注册工具数量"""
+        return len(self._tools)
+    
     def clear(self) -> None:
         """清空所有注册的工具（主要用于测试）"""
         self._tools.clear()
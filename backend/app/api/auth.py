@@ -81,7 +81,6 @@ async def register(
     )
     db.add(user)
     await db.commit()
-    await db.refresh(user)
     
     logger.info(f"用户注册成功: id={user.id}, username={user.username}")
     
@@ -92,7 +91,7 @@ async def register(
             "user_id": str(user.id),
             "username": user.username,
             "nickname": user.nickname,
-            "created_at": user.created_at.isoformat() if user.created_at else None
+            "created_at": user.created_at_iso
         }
     }
 
@@ -143,7 +142,7 @@ async def login(
             "user_id": str(user.id),
             "username": user.username,
             "nickname": user.nickname,
-            "created_at": user.created_at.isoformat() if user.created_at else None
+            "created_at": user.created_at_iso
         }
     }
 
@@ -182,7 +181,7 @@ async def login_by_id(
             "user_id": str(user.id),
             "username": user.username,
             "nickname": user.nickname,
-            "created_at": user.created_at.isoformat() if user.created_at else None
+            "created_at": user.created_at_iso
         }
     }
 
@@ -217,6 +216,6 @@ async def get_current_user(
             "user_id": str(user.id),
             "username": user.username,
             "nickname": user.nickname,
-            "created_at": user.created_at.isoformat() if user.created_at else None
+            "created_at": user.created_at_iso
         }
     }
@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
+from app.models.base import uuid_to_str
 from app.services.conversation import ConversationService
 from app.utils.logger import get_logger
 
@@ -108,10 +109,10 @@ async def list_conversations(
         "data": {
             "conversations": [
                 {
-                    "id": c.id,
-                    "user_id": c.user_id,
+                    "id": uuid_to_str(c.id),
+                    "user_id": uuid_to_str(c.user_id),
                     "title": c.title,
-                    "created_at": c.created_at.isoformat() if c.created_at else None,
+                    "created_at": c.created_at_iso,
                     "updated_at": c.updated_at.isoformat() if c.updated_at else None
                 }
                 for c in conversations
@@ -141,10 +142,10 @@ async def create_conversation(
         "code": 0,
         "message": "success",
         "data": {
-            "id": conversation.id,
-            "user_id": conversation.user_id,
+            "id": uuid_to_str(conversation.id),
+            "user_id": uuid_to_str(conversation.user_id),
             "title": conversation.title,
-            "created_at": conversation.created_at.isoformat() if conversation.created_at else None,
+            "created_at": conversation.created_at_iso,
             "updated_at": conversation.updated_at.isoformat() if conversation.updated_at else None
         }
     }
@@ -171,21 +172,21 @@ async def get_conversation(
         raise HTTPException(status_code=404, detail="对话不存在")
     
     data = {
-        "id": conversation.id,
-        "user_id": conversation.user_id,
+        "id": uuid_to_str(conversation.id),
+        "user_id": uuid_to_str(conversation.user_id),
         "title": conversation.title,
-        "created_at": conversation.created_at.isoformat() if conversation.created_at else None,
+        "created_at": conversation.created_at_iso,
         "updated_at": conversation.updated_at.isoformat() if conversation.updated_at else None
     }
     
     if include_messages:
         data["messages"] = [
             {
-                "id": m.id,
+                "id": uuid_to_str(m.id),
                 "role": m.role,
                 "content": m.content,
                 "metadata": m.extra_data,
-                "created_at": m.created_at.isoformat() if m.created_at else None
+                "created_at": m.created_at_iso
             }
             for m in conversation.messages
         ]
@@ -221,7 +222,7 @@ async def update_conversation(
         "code": 0,
         "message": "success",
         "data": {
-            "id": conversation.id,
+            "id": uuid_to_str(conversation.id),
             "title": conversation.title,
             "updated_at": conversation.updated_at.isoformat() if conversation.updated_at else None
         }
@@ -281,11 +282,11 @@ async def get_messages(
         "data": {
             "messages": [
                 {
-                    "id": m.id,
+                    "id": uuid_to_str(m.id),
                     "role": m.role,
                     "content": m.content,
                     "metadata": m.extra_data,
-                    "created_at": m.created_at.isoformat() if m.created_at else None
+                    "created_at": m.created_at_iso
                 }
                 for m in messages
             ],
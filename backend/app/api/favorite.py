@@ -55,7 +55,6 @@ async def create_favorite(
         )
         db.add(favorite)
         await db.commit()
-        await db.refresh(favorite)
         
         return {
             "code": 0,
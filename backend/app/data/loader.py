@@ -1,10 +1,11 @@
 # 数据加载服务
 # 负责从 JSON 文件加载配置和市场数据，提供单例模式访问
 
-import json
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
 
 from app.models.data_models import (
     InterestRatesConfig,
@@ -17,6 +18,8 @@ from app.models.data_models import (
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class DataLoader:
     """
@@ -49,6 +52,9 @@ class DataLoader:
         self._market_data: dict[str, CityMarketData] = {}
         self._houses_data: dict[str, CityHousesData] = {}
         
+        # 已加载文件的修改时间（reload 时据此判断是否需要重新解析）
+        self._mtimes: dict[Path, int] = {}
+        
         # 城市名到文件名的映射
         self._city_file_map = {
             "南宁": "nanning",
@@ -58,17 +64,25 @@ class DataLoader:
         self._initialized = True
         logger.info(f"DataLoader 初始化完成，数据目录: {self._data_dir}")
     
-    def _load_json(self, path: Path) -> dict:
-        """加载 JSON 文件"""
+    def _load_model(self, path: Path, model: type[ModelT]) -> ModelT:
+        """
+        加载 JSON 文件并校验为模型
+        
+        直接把文件字节交给 pydantic-core 解析校验，不经过中间的 Python dict
+        """
         if not path.exists():
             raise FileNotFoundError(f"数据文件不存在: {path}")
         
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 解析错误: {path}, {e}")
-            raise ValueError(f"数据文件格式错误: {path}")
+            mtime = path.stat().st_mtime_ns
+            result = model.model_validate_json(path.read_bytes())
+            self._mtimes[path] = mtime
+            return result
+        except ValidationError as e:
+            if any(err["type"] == "json_invalid" for err in e.errors()):
+                logger.error(f"JSON 解析错误: {path}, {e}")
+                raise ValueError(f"数据文件格式错误: {path}")
+            raise
     
     # ========== 配置数据访问 ==========
     
@@ -77,8 +91,7 @@ class DataLoader:
         """获取利率配置"""
         if self._interest_rates is None:
             path = self._data_dir / "config" / "interest_rates.json"
-            data = self._load_json(path)
-            self._interest_rates = InterestRatesConfig(**data)
+            self._interest_rates = self._load_model(path, InterestRatesConfig)
             logger.debug(f"加载利率配置: {path}")
         return self._interest_rates
     
@@ -87,8 +100,7 @@ class DataLoader:
         """获取税费规则"""
         if self._tax_rules is None:
             path = self._data_dir / "config" / "tax_rules.json"
-            data = self._load_json(path)
-            self._tax_rules = TaxRulesConfig(**data)
+            self._tax_rules = self._load_model(path, TaxRulesConfig)
             logger.debug(f"加载税费规则: {path}")
         return self._tax_rules
     
@@ -97,8 +109,7 @@ class DataLoader:
         """获取公积金政策"""
         if self._provident_fund is None:
             path = self._data_dir / "config" / "provident_fund.json"
-            data = self._load_json(path)
-            self._provident_fund = ProvidentFundConfig(**data)
+            self._provident_fund = self._load_model(path, ProvidentFundConfig)
             logger.debug(f"加载公积金政策: {path}")
         return self._provident_fund
     
@@ -107,8 +118,7 @@ class DataLoader:
         """获取费用标准"""
         if self._cost_reference is None:
             path = self._data_dir / "config" / "cost_reference.json"
-            data = self._load_json(path)
-            self._cost_reference = CostReferenceConfig(**data)
+            self._cost_reference = self._load_model(path, CostReferenceConfig)
             logger.debug(f"加载费用标准: {path}")
         return self._cost_reference
     
@@ -136,8 +146,7 @@ class DataLoader:
                 return None
             
             try:
-                data = self._load_json(path)
-                self._market_data[city] = CityMarketData(**data)
+                self._market_data[city] = self._load_model(path, CityMarketData)
                 logger.debug(f"加载市场数据: {path}")
             except Exception as e:
                 logger.error(f"加载市场数据失败: {path}, {e}")
@@ -167,8 +176,7 @@ class DataLoader:
                 return None
             
             try:
-                data = self._load_json(path)
-                self._houses_data[city] = CityHousesData(**data)
+                self._houses_data[city] = self._load_model(path, CityHousesData)
                 logger.debug(f"加载房源数据: {path}")
             except Exception as e:
                 logger.error(f"加载房源数据失败: {path}, {e}")
@@ -241,14 +249,37 @@ class DataLoader:
     
     # ========== 数据管理 ==========
     
+    def _is_stale(self, path: Path) -> bool:
+        """文件自上次加载后是否有变化（修改时间不同或文件已删除）"""
+        try:
+            return path.stat().st_mtime_ns != self._mtimes.get(path)
+        except FileNotFoundError:
+            return True
+    
     def reload(self):
-        """重新加载所有数据（热更新）"""
-        self._interest_rates = None
-        self._tax_rules = None
-        self._provident_fund = None
-        self._cost_reference = None
-        self._market_data.clear()
-        self._houses_data.clear()
+        """
+        重新加载数据（热更新）
+        
+        只清除源文件修改时间发生变化的缓存，未变化的数据不重新解析
+        """
+        config_dir = self._data_dir / "config"
+        if self._is_stale(config_dir / "interest_rates.json"):
+            self._interest_rates = None
+        if self._is_stale(config_dir / "tax_rules.json"):
+            self._tax_rules = None
+        if self._is_stale(config_dir / "provident_fund.json"):
+            self._provident_fund = None
+        if self._is_stale(config_dir / "cost_reference.json"):
+            self._cost_reference = None
+        
+        market_dir = self._data_dir / "market"
+        for city in list(self._market_data):
+            if self._is_stale(market_dir / f"{self._city_file_map[city]}.json"):
+                del self._market_data[city]
+        for city in list(self._houses_data):
+            if self._is_stale(market_dir / "houses" / f"{self._city_file_map[city]}_houses.json"):
+                del self._houses_data[city]
+        
         logger.info("数据已重新加载")
     
     def validate_required_files(self) -> list[str]:
@@ -21,6 +21,9 @@ class ChromaClient:
     COLLECTION_FAQ = "faq"            # 常见问题
     COLLECTION_GUIDES = "guides"      # 购房指南
     
+    # Collection 元数据中记录向量所用 embedding 模型的键
+    METADATA_EMBEDDING_MODEL = "embedding_model_id"
+    
     def __init__(
         self, 
         host: str = "localhost", 
@@ -40,6 +43,7 @@ class ChromaClient:
         self._client: Optional[chromadb.HttpClient] = None
         self._collections: dict = {}
         self._embedding_fn = None
+        self._embedding_model_id = "default"
         
         # 设置本地 embedding 模型
         if embedding_model_path:
@@ -49,6 +53,7 @@ class ChromaClient:
                 self._embedding_fn = embedding_functions.SentenceTransformerEmbeddingFunction(
                     model_name=str(model_path)
                 )
+                self._embedding_model_id = str(model_path)
             else:
                 logger.warning(f"本地模型路径不存在: {model_path}，将使用 Chroma 默认模型")
         
@@ -57,6 +62,23 @@ class ChromaClient:
             logger.info("使用默认 embedding 模型")
             self._embedding_fn = embedding_functions.DefaultEmbeddingFunction()
     
+    @property
+    def embedding_model_id(self) -> str:
+        """当前 embedding 模型标识（本地模型路径，或 default）"""
+        return self._embedding_model_id
+    
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        使用当前 embedding 模型计算向量
+        
+        Args:
+            texts: 文本列表
+        
+        Returns:
+            向量列表
+        """
+        return [[float(x) for x in vector] for vector in self._embedding_fn(texts)]
+    
     async def connect(self) -> None:
         """连接 Chroma 服务"""
         try:
@@ -109,19 +131,47 @@ class ChromaClient:
         if name not in self._collections:
             self._collections[name] = self._client.get_or_create_collection(
                 name=name,
-                metadata=metadata or {"hnsw:space": "cosine"},
+                metadata=metadata or {
+                    "hnsw:space": "cosine",
+                    self.METADATA_EMBEDDING_MODEL: self._embedding_model_id
+                },
                 embedding_function=self._embedding_fn
             )
             logger.info(f"获取/创建 Collection: {name}")
         
         return self._collections[name]
     
+    def get_collection_metadata(self, name: str) -> Optional[dict]:
+        """
+        获取已存在 Collection 的元数据（不会创建 Collection）
+        
+        Args:
+            name: Collection 名称
+        
+        Returns:
+            Collection 元数据；Collection 不存在时返回 None
+        """
+        if not self._client:
+            raise RuntimeError("Chroma 客户端未连接")
+        
+        if name not in self._collections:
+            try:
+                self._collections[name] = self._client.get_collection(
+                    name=name,
+                    embedding_function=self._embedding_fn
+                )
+            except Exception:
+                return None
+        
+        return self._collections[name].metadata or {}
+    
     def add_documents(
         self,
         collection_name: str,
         documents: list[str],
         metadatas: list[dict],
-        ids: list[str]
+        ids: list[str],
+        embeddings: Optional[list[list[float]]] = None
     ) -> None:
         """
         添加文档到 Collection
@@ -131,15 +181,70 @@ class ChromaClient:
             documents: 文档内容列表
             metadatas: 元数据列表
             ids: 文档ID列表
+            embeddings: 预先计算好的向量（可选，不传则由 Collection 的 embedding 模型计算）
         """
         collection = self.get_or_create_collection(collection_name)
         collection.add(
             documents=documents,
             metadatas=metadatas,
-            ids=ids
+            ids=ids,
+            embeddings=embeddings
         )
         logger.info(f"添加 {len(documents)} 个文档到 {collection_name}")
     
+    def upsert_documents(
+        self,
+        collection_name: str,
+        documents: list[str],
+        metadatas: list[dict],
+        ids: list[str],
+        embeddings: Optional[list[list[float]]] = None
+    ) -> None:
+        """
+        新增或更新 Collection 中的文档（ID 已存在则覆盖）
+        
+        Args:
+            collection_name: Collection 名称
+            documents: 文档内容列表
+            metadatas: 元数据列表
+            ids: 文档ID列表
+            embeddings: 预先计算好的向量（可选）
+        """
+        collection = self.get_or_create_collection(collection_name)
+        collection.upsert(
+            documents=documents,
+            metadatas=metadatas,
+            ids=ids,
+            embeddings=embeddings
+        )
+        logger.info(f"写入 {len(documents)} 个文档到 {collection_name}")
+    
+    def get_metadatas(self, collection_name: str) -> dict[str, dict]:
+        """
+        获取 Collection 中全部文档的元数据
+        
+        Args:
+            collection_name: Collection 名称
+        
+        Returns:
+            文档ID到元数据的映射
+        """
+        collection = self.get_or_create_collection(collection_name)
+        result = collection.get(include=["metadatas"])
+        return dict(zip(result["ids"], result["metadatas"]))
+    
+    def delete_documents(self, collection_name: str, ids: list[str]) -> None:
+        """
+        按 ID 删除文档
+        
+        Args:
+            collection_name: Collection 名称
+            ids: 文档ID列表
+        """
+        collection = self.get_or_create_collection(collection_name)
+        collection.delete(ids=ids)
+        logger.info(f"从 {collection_name} 删除 {len(ids)} 个文档")
+    
     def query(
         self,
         collection_name: str,
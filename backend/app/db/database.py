@@ -2,7 +2,8 @@
 数据库连接管理模块
 管理 PostgreSQL 和 Redis 的异步连接
 """
-from typing import Optional
+from typing import Any, Optional
+import orjson
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import text
@@ -13,6 +14,11 @@ from app.utils.logger import get_logger
 logger = get_logger("house_advisor.db")
 
 
+def _orjson_serializer(obj: Any) -> str:
+    """JSONB 序列化（asyncpg 编解码器要求返回 str）"""
+    return orjson.dumps(obj).decode("utf-8")
+
+
 class Database:
     """数据库连接管理类"""
     
@@ -35,7 +41,10 @@ class Database:
             async_database_url,
             echo=debug,  # 开发环境打印 SQL
             pool_size=5,
-            max_overflow=10
+            max_overflow=10,
+            # JSONB 列（metadata）使用 orjson 编解码
+            json_serializer=_orjson_serializer,
+            json_deserializer=orjson.loads
         )
         
         # 异步会话工厂
@@ -5,13 +5,13 @@ FastAPI 应用主入口
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 
 from app.config.settings import get_settings
 from app.db.database import Database
 from app.api import health, chat, calculator, conversation, auth, favorite
-from app.utils.logger import setup_logging, get_logger
+from app.utils.logger import setup_logging, shutdown_logging, get_logger
 from app.utils.exceptions import BaseAppException, LLMException, ToolException
 
 # 加载配置
@@ -28,7 +28,8 @@ async def lifespan(app: FastAPI):
     应用生命周期管理
     启动时连接数据库，关闭时断开连接
     """
-    # 启动时
+    # 启动时（上一次生命周期结束时日志线程已停止，这里重新启动；已启动时不做任何事）
+    setup_logging(debug=settings.DEBUG)
     logger.info(f"正在启动 {settings.APP_NAME} v{settings.APP_VERSION}")
     
     # 初始化数据库连接
@@ -65,6 +66,7 @@ async def lifespan(app: FastAPI):
     if database.db:
         await database.db.disconnect()
     logger.info("服务已关闭")
+    shutdown_logging()
 
 
 # 创建 FastAPI 应用
@@ -72,6 +74,7 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="基于多智能体协作的购房决策智能助手",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -109,7 +112,7 @@ async def app_exception_handler(request: Request, exc: BaseAppException):
     else:
         logger.warning(f"业务异常: code={exc.code}, message={exc.message}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.http_status,
         content=exc.to_dict()
     )
@@ -134,7 +137,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     
     logger.warning(f"请求验证失败: {message}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "code": 3001,
@@ -152,7 +155,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     """
     logger.exception(f"未处理的异常: {exc}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "code": 1099,
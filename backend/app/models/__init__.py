@@ -1,7 +1,7 @@
 # 数据模型模块
 # 包含 SQLAlchemy ORM 模型和 Pydantic 模型定义
 
-from app.models.base import Base, TimestampMixin, generate_uuid
+from app.models.base import Base, TimestampMixin, generate_uuid, uuid_to_str
 from app.models.user import User
 from app.models.conversation import Conversation
 from app.models.message import Message
@@ -11,6 +11,7 @@ __all__ = [
     "Base",
     "TimestampMixin",
     "generate_uuid",
+    "uuid_to_str",
     "User",
     "Conversation",
     "Message",
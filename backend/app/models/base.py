@@ -28,8 +28,21 @@ class TimestampMixin:
         nullable=False,
         comment="更新时间"
     )
+    
+    @property
+    def created_at_iso(self) -> str | None:
+        """创建时间的 ISO 格式字符串（创建时间不会变化，首次计算后缓存在实例上）"""
+        iso = self.__dict__.get("_created_at_iso")
+        if iso is None and self.created_at is not None:
+            iso = self._created_at_iso = self.created_at.isoformat()
+        return iso
 
 
-def generate_uuid():
+def generate_uuid() -> uuid.UUID:
     """生成 UUID"""
-    return str(uuid.uuid4())
+    return uuid.uuid4()
+
+
+def uuid_to_str(value: uuid.UUID | str | None) -> str | None:
+    """UUID 转字符串，仅在序列化边界调用；None 原样返回"""
+    return str(value) if value is not None else None
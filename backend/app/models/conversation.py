@@ -2,7 +2,7 @@
 对话会话模型
 存储用户与 AI 的对话会话
 """
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, Integer, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -17,7 +17,7 @@ class Conversation(Base, TimestampMixin):
     
     # 主键
     id = Column(
-        UUID(as_uuid=False),
+        UUID(as_uuid=True),
         primary_key=True,
         default=generate_uuid,
         comment="对话ID"
@@ -25,7 +25,7 @@ class Conversation(Base, TimestampMixin):
     
     # 外键：关联用户（可选，支持匿名对话）
     user_id = Column(
-        UUID(as_uuid=False),
+        UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
         index=True,
@@ -39,6 +39,15 @@ class Conversation(Base, TimestampMixin):
         comment="对话标题"
     )
     
+    # 消息数量（由 messages 表上的触发器维护，只读）
+    message_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="消息数量"
+    )
+    
     # 关系
     user = relationship("User", back_populates="conversations")
     messages = relationship(
@@ -1,37 +1,46 @@
 # 数据模型定义
 # 用于验证 JSON 配置文件和市场数据的格式
 
-from pydantic import BaseModel
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
+class DataModel(BaseModel):
+    """
+    数据模型基类
+    延迟构建校验器：模型在首次加载对应数据文件时才构建，导入本模块时不产生开销
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
 # ========== 配置数据模型 ==========
 
-class LPRRates(BaseModel):
+class LPRRates(DataModel):
     """LPR 利率"""
     lpr_1y: float  # 1年期 LPR
     lpr_5y: float  # 5年期 LPR
 
 
-class LoanRateConfig(BaseModel):
+class LoanRateConfig(DataModel):
     """贷款利率配置"""
     rate: float
     rate_formula: str
 
 
-class CommercialLoanRates(BaseModel):
+class CommercialLoanRates(DataModel):
     """商业贷款利率"""
     first_home: LoanRateConfig
     second_home: LoanRateConfig
 
 
-class ProvidentFundRates(BaseModel):
+class ProvidentFundRates(DataModel):
     """公积金利率"""
     below_5y: float
     above_5y: float
 
 
-class InterestRatesConfig(BaseModel):
+class InterestRatesConfig(DataModel):
     """利率配置"""
     update_date: str
     lpr: LPRRates
@@ -39,29 +48,37 @@ class InterestRatesConfig(BaseModel):
     provident_fund: ProvidentFundRates
 
 
-class DeedTaxRates(BaseModel):
+class DeedTaxRates(DataModel):
     """契税税率"""
     first_home_below_90: float
     first_home_above_90: float
     second_home_below_90: float
     second_home_above_90: float
     third_home: float
+    
+    @cached_property
+    def rate_table(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        """税率查找表，按 [是否首套][面积是否大于90㎡] 索引"""
+        return (
+            (self.second_home_below_90, self.second_home_above_90),
+            (self.first_home_below_90, self.first_home_above_90),
+        )
 
 
-class VATRates(BaseModel):
+class VATRates(DataModel):
     """增值税税率"""
     below_2y: float
     above_2y: float
 
 
-class IncomeTaxRates(BaseModel):
+class IncomeTaxRates(DataModel):
     """个税税率"""
     rate: float
     diff_rate: float
     full_5y_only: float
 
 
-class OtherFees(BaseModel):
+class OtherFees(DataModel):
     """其他费用"""
     registration_fee: float
     stamp_duty: float
@@ -69,7 +86,7 @@ class OtherFees(BaseModel):
     misc_fees: float
 
 
-class TaxRulesConfig(BaseModel):
+class TaxRulesConfig(DataModel):
     """税费规则配置"""
     update_date: str
     deed_tax: DeedTaxRates
@@ -78,7 +95,7 @@ class TaxRulesConfig(BaseModel):
     other_fees: OtherFees
 
 
-class CityProvidentFund(BaseModel):
+class CityProvidentFund(DataModel):
     """城市公积金政策"""
     single_max_loan: int
     couple_max_loan: int
@@ -89,7 +106,7 @@ class CityProvidentFund(BaseModel):
     loan_rate_above_5y: float
 
 
-class ProvidentFundConfig(BaseModel):
+class ProvidentFundConfig(DataModel):
     """公积金政策配置"""
     update_date: str
     cities: dict[str, CityProvidentFund]
@@ -97,7 +114,7 @@ class ProvidentFundConfig(BaseModel):
 
 # ========== 市场数据模型 ==========
 
-class DistrictMarketData(BaseModel):
+class DistrictMarketData(DataModel):
     """区域市场数据"""
     avg_price: int
     price_range: list[int]
@@ -110,13 +127,13 @@ class DistrictMarketData(BaseModel):
     description: str
 
 
-class PriceTrendPoint(BaseModel):
+class PriceTrendPoint(DataModel):
     """价格走势点"""
     month: str
     price: int
 
 
-class CityMarketData(BaseModel):
+class CityMarketData(DataModel):
     """城市市场数据"""
     city: str
     update_date: str
@@ -126,13 +143,13 @@ class CityMarketData(BaseModel):
 
 # ========== 房源数据模型 ==========
 
-class PriceHistoryPoint(BaseModel):
+class PriceHistoryPoint(DataModel):
     """价格历史点"""
     date: str
     price: int
 
 
-class HouseData(BaseModel):
+class HouseData(DataModel):
     """房源数据"""
     house_id: str
     district: str
@@ -153,7 +170,7 @@ class HouseData(BaseModel):
     price_history: list[PriceHistoryPoint]
 
 
-class CityHousesData(BaseModel):
+class CityHousesData(DataModel):
     """城市房源数据"""
     city: str
     update_date: str
@@ -162,7 +179,7 @@ class CityHousesData(BaseModel):
 
 # ========== 费用标准模型 ==========
 
-class CostRange(BaseModel):
+class CostRange(DataModel):
     """费用范围"""
     min: float
     max: float
@@ -170,7 +187,7 @@ class CostRange(BaseModel):
     desc: Optional[str] = None
 
 
-class CostRangeSimple(BaseModel):
+class CostRangeSimple(DataModel):
     """简单费用范围"""
     min: float
     max: float
@@ -178,13 +195,13 @@ class CostRangeSimple(BaseModel):
     avg: Optional[float] = None
 
 
-class ParkingCost(BaseModel):
+class ParkingCost(DataModel):
     """停车费用"""
     buy: CostRangeSimple
     rent: CostRangeSimple
 
 
-class CostReferenceConfig(BaseModel):
+class CostReferenceConfig(DataModel):
     """费用标准配置"""
     update_date: str
     decoration_cost: dict[str, CostRange]
@@ -6,7 +6,7 @@ from sqlalchemy import Column, String, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
-from app.models.base import Base, TimestampMixin, generate_uuid
+from app.models.base import Base, TimestampMixin, generate_uuid, uuid_to_str
 
 
 class Favorite(Base, TimestampMixin):
@@ -21,7 +21,7 @@ class Favorite(Base, TimestampMixin):
     
     # 主键
     id = Column(
-        UUID(as_uuid=False),
+        UUID(as_uuid=True),
         primary_key=True,
         default=generate_uuid,
         comment="收藏ID"
@@ -29,7 +29,7 @@ class Favorite(Base, TimestampMixin):
     
     # 外键：关联用户
     user_id = Column(
-        UUID(as_uuid=False),
+        UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -38,7 +38,7 @@ class Favorite(Base, TimestampMixin):
     
     # 关联的消息ID（可选，用于跳转）
     message_id = Column(
-        UUID(as_uuid=False),
+        UUID(as_uuid=True),
         ForeignKey("messages.id", ondelete="SET NULL"),
         nullable=True,
         comment="关联消息ID"
@@ -46,7 +46,7 @@ class Favorite(Base, TimestampMixin):
     
     # 关联的对话ID（用于跳转）
     conversation_id = Column(
-        UUID(as_uuid=False),
+        UUID(as_uuid=True),
         ForeignKey("conversations.id", ondelete="SET NULL"),
         nullable=True,
         comment="关联对话ID"
@@ -81,18 +81,17 @@ class Favorite(Base, TimestampMixin):
     conversation = relationship("Conversation")
     
     def __repr__(self):
-        question_preview = self.question[:30] + "..." if len(self.question) > 30 else self.question
-        return f"<Favorite(id={self.id}, question={question_preview})>"
+        return f"<Favorite(id={self.id}, question={self.question[:30]}{'...' if len(self.question) > 30 else ''})>"
     
     def to_dict(self) -> dict:
         """转换为字典格式"""
         return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "message_id": self.message_id,
-            "conversation_id": self.conversation_id,
+            "id": uuid_to_str(self.id),
+            "user_id": uuid_to_str(self.user_id),
+            "message_id": uuid_to_str(self.message_id),
+            "conversation_id": uuid_to_str(self.conversation_id),
             "question": self.question,
             "answer": self.answer,
             "metadata": self.extra_data,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at_iso
         }
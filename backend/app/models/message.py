@@ -6,7 +6,7 @@ from sqlalchemy import Column, String, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
-from app.models.base import Base, TimestampMixin, generate_uuid
+from app.models.base import Base, TimestampMixin, generate_uuid, uuid_to_str
 
 
 class Message(Base, TimestampMixin):
@@ -21,7 +21,7 @@ class Message(Base, TimestampMixin):
     
     # 主键
     id = Column(
-        UUID(as_uuid=False),
+        UUID(as_uuid=True),
         primary_key=True,
         default=generate_uuid,
         comment="消息ID"
@@ -29,7 +29,7 @@ class Message(Base, TimestampMixin):
     
     # 外键：关联对话
     conversation_id = Column(
-        UUID(as_uuid=False),
+        UUID(as_uuid=True),
         ForeignKey("conversations.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -63,16 +63,15 @@ class Message(Base, TimestampMixin):
     conversation = relationship("Conversation", back_populates="messages")
     
     def __repr__(self):
-        content_preview = self.content[:30] + "..." if len(self.content) > 30 else self.content
-        return f"<Message(id={self.id}, role={self.role}, content={content_preview})>"
+        return f"<Message(id={self.id}, role={self.role}, content={self.content[:30]}{'...' if len(self.content) > 30 else ''})>"
     
     def to_dict(self) -> dict:
         """转换为字典格式"""
         return {
-            "id": self.id,
-            "conversation_id": self.conversation_id,
+            "id": uuid_to_str(self.id),
+            "conversation_id": uuid_to_str(self.conversation_id),
             "role": self.role,
             "content": self.content,
             "metadata": self.extra_data,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at_iso
         }
@@ -17,7 +17,7 @@ class User(Base, TimestampMixin):
     
     # 主键
     id = Column(
-        UUID(as_uuid=False),
+        UUID(as_uuid=True),
         primary_key=True,
         default=generate_uuid,
         comment="用户ID"
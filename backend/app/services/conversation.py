@@ -2,9 +2,10 @@
 对话历史服务
 提供对话和消息的 CRUD 操作
 """
+import logging
 from typing import Optional
 from datetime import datetime
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, delete, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -15,6 +16,17 @@ from app.utils.logger import get_logger
 
 logger = get_logger("house_advisor.services.conversation")
 
+# 热点查询语句在模块级构建一次，SQL 文本稳定，便于命中 asyncpg 的预编译语句缓存
+_SELECT_CONVERSATION = select(Conversation).where(Conversation.id == bindparam("conversation_id"))
+_SELECT_CONVERSATION_WITH_MESSAGES = _SELECT_CONVERSATION.options(selectinload(Conversation.messages))
+_SELECT_MESSAGES = (
+    select(Message)
+    .where(Message.conversation_id == bindparam("conversation_id"))
+    .order_by(Message.created_at.asc())
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+)
+
 
 class ConversationService:
     """对话历史服务类"""
@@ -51,7 +63,6 @@ class ConversationService:
         )
         self.session.add(conversation)
         await self.session.commit()
-        await self.session.refresh(conversation)
         
         logger.info(f"创建对话: id={conversation.id}, user_id={user_id}")
         return conversation
@@ -71,12 +82,8 @@ class ConversationService:
         Returns:
             对话对象，不存在返回 None
         """
-        query = select(Conversation).where(Conversation.id == conversation_id)
-        
-        if include_messages:
-            query = query.options(selectinload(Conversation.messages))
-        
-        result = await self.session.execute(query)
+        query = _SELECT_CONVERSATION_WITH_MESSAGES if include_messages else _SELECT_CONVERSATION
+        result = await self.session.execute(query, {"conversation_id": conversation_id})
         return result.scalar_one_or_none()
     
     async def list_conversations(
@@ -129,7 +136,6 @@ class ConversationService:
             conversation.title = title
             conversation.updated_at = datetime.utcnow()
             await self.session.commit()
-            await self.session.refresh(conversation)
             logger.info(f"更新对话标题: id={conversation_id}, title={title}")
         return conversation
     
@@ -193,9 +199,9 @@ class ConversationService:
                 conversation.title = content[:30] + ("..." if len(content) > 30 else "")
         
         await self.session.commit()
-        await self.session.refresh(message)
         
-        logger.debug(f"添加消息: conversation_id={conversation_id}, role={role}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"添加消息: conversation_id={conversation_id}, role={role}")
         return message
     
     async def get_messages(
@@ -215,15 +221,10 @@ class ConversationService:
         Returns:
             消息列表（按时间正序）
         """
-        query = (
-            select(Message)
-            .where(Message.conversation_id == conversation_id)
-            .order_by(Message.created_at.asc())
-            .limit(limit)
-            .offset(offset)
+        result = await self.session.execute(
+            _SELECT_MESSAGES,
+            {"conversation_id": conversation_id, "limit": limit, "offset": offset}
         )
-        
-        result = await self.session.execute(query)
         return list(result.scalars().all())
     
     async def get_recent_messages(
@@ -268,9 +269,10 @@ class ConversationService:
         Returns:
             消息数量
         """
+        # message_count 由数据库触发器维护，读列即可，无需 count(*) 扫描
         query = (
-            select(func.count(Message.id))
-            .where(Message.conversation_id == conversation_id)
+            select(Conversation.message_count)
+            .where(Conversation.id == conversation_id)
         )
         result = await self.session.execute(query)
         return result.scalar() or 0
@@ -303,7 +305,6 @@ class ConversationService:
         user = User(nickname=nickname)
         self.session.add(user)
         await self.session.commit()
-        await self.session.refresh(user)
         
         logger.info(f"创建用户: id={user.id}, nickname={nickname}")
         return user
@@ -1,34 +1,5 @@
 # 工具模块
 
-from app.utils.exceptions import (
-    # 基类
-    BaseAppException,
-    # LLM 错误
-    LLMException,
-    LLMTimeoutError,
-    LLMAuthError,
-    LLMRateLimitError,
-    LLMUnknownError,
-    # 工具错误
-    ToolException,
-    ToolValidationError,
-    ToolDataQueryError,
-    ToolCalculationError,
-    # 请求错误
-    RequestException,
-    MissingParameterError,
-    InvalidParameterTypeError,
-    ResourceNotFoundError,
-    # 数据库错误
-    DatabaseException,
-    DatabaseConnectionError,
-    DatabaseQueryError,
-    # 会话错误
-    SessionException,
-    SessionNotFoundError,
-    SessionExpiredError,
-)
-
 __all__ = [
     # 基类
     "BaseAppException",
@@ -57,3 +28,13 @@ __all__ = [
     "SessionNotFoundError",
     "SessionExpiredError",
 ]
+
+# 异常类按需加载（PEP 562），只使用 logger 的模块无需导入 exceptions
+_EXC_NAMES = frozenset(__all__)
+
+
+def __getattr__(name: str):
+    if name in _EXC_NAMES:
+        from app.utils import exceptions
+        return getattr(exceptions, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@
 统一异常处理模块
 定义业务异常类，用于规范化错误处理
 """
-from typing import Any
+from typing import Any, ClassVar
 
 
 class BaseAppException(Exception):
@@ -14,6 +14,13 @@ class BaseAppException(Exception):
     message: str = "服务暂时不可用，请稍后重试"
     http_status: int = 500
     
+    # 默认响应模板，子类定义时按其 code/message 重新生成
+    _default_dict: ClassVar[dict] = {"code": code, "message": message, "data": None}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._default_dict = {"code": cls.code, "message": cls.message, "data": None}
+    
     def __init__(
         self,
         message: str | None = None,
@@ -27,6 +34,10 @@ class BaseAppException(Exception):
     
     def to_dict(self) -> dict:
         """转换为响应字典格式"""
+        cls = self.__class__
+        if self.data is None and self.code == cls.code and self.message is cls.message:
+            # 默认错误（如 raise LLMTimeoutError()）直接复制模板，无需逐字段构建
+            return cls._default_dict.copy()
         return {
             "code": self.code,
             "message": self.message,
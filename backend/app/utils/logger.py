@@ -3,15 +3,22 @@
 统一日志格式和级别管理
 """
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 
 # 日志目录
 LOG_DIR = Path(__file__).parent.parent.parent / "logs"
 
+# 后台日志线程及对应的队列 handler（按 logger 名称记录，由 setup_logging 启动，shutdown_logging 停止并移除）
+_queue_listeners: dict[str, tuple[QueueHandler, QueueListener]] = {}
+
+# 已获取的 logger 缓存，get_logger 命中时无需经过 logging 模块的全局锁
+_loggers: dict[str, logging.Logger] = {}
+
 
 def setup_logging(debug: bool = False, name: Optional[str] = None) -> logging.Logger:
     """
@@ -41,13 +48,16 @@ def setup_logging(debug: bool = False, name: Optional[str] = None) -> logging.Lo
     if logger.handlers:
         return logger
     
+    handlers: list[logging.Handler] = []
+    
     # 控制台输出
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(level)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # 文件输出（滚动日志，最大 10MB，保留 5 个备份）
+    file_error: Optional[Exception] = None
     try:
         LOG_DIR.mkdir(parents=True, exist_ok=True)
         file_handler = RotatingFileHandler(
@@ -58,9 +68,22 @@ def setup_logging(debug: bool = False, name: Optional[str] = None) -> logging.Lo
         )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.DEBUG)  # 文件记录所有级别
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
-        logger.warning(f"无法创建文件日志: {e}")
+        file_error = e
+    
+    # 通过队列交给后台线程写入，避免在事件循环线程上做阻塞 I/O
+    # （QueueHandler.prepare 仍会在调用线程上格式化消息，移到后台的只是输出）
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners[logger_name] = (queue_handler, listener)
+    
+    if file_error is not None:
+        logger.warning(f"无法创建文件日志: {file_error}")
     
     # 阻止日志传播到根 logger
     logger.propagate = False
@@ -68,6 +91,28 @@ def setup_logging(debug: bool = False, name: Optional[str] = None) -> logging.Lo
     return logger
 
 
+def shutdown_logging(name: Optional[str] = None) -> None:
+    """
+    停止后台日志线程，并把队列中剩余的日志全部写出
+    
+    同时从 logger 上移除队列 handler 并关闭输出 handler，
+    之后再次调用 setup_logging 会重新创建 handler 和后台线程
+    
+    Args:
+        name: 日志器名称，默认停止所有已启动的日志线程
+    """
+    names = [name] if name is not None else list(_queue_listeners)
+    for logger_name in names:
+        entry = _queue_listeners.pop(logger_name, None)
+        if entry is None:
+            continue
+        queue_handler, listener = entry
+        logging.getLogger(logger_name).removeHandler(queue_handler)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
 def get_logger(name: str = "house_advisor") -> logging.Logger:
     """
     获取已配置的 logger
@@ -78,4 +123,7 @@ def get_logger(name: str = "house_advisor") -> logging.Logger:
     Returns:
         Logger 实例
     """
-    return logging.getLogger(name)
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = logging.getLogger(name)
+    return logger
@@ -17,7 +17,7 @@ DATA_DIR = Path(__file__).parent.parent / "data" / "knowledge"
 
 
 def generate_doc_id(content: str, prefix: str = "") -> str:
-    hash_val = hashlib.md5(content.encode()).hexdigest()[:8]
+    hash_val = hashlib.blake2b(content.encode("utf-8"), digest_size=4).hexdigest()
     return f"{prefix}_{hash_val}" if prefix else hash_val
 
 
@@ -3,12 +3,17 @@
 将政策文档、FAQ、购房指南导入 Chroma 向量数据库
 """
 import os
+import re
 import sys
-import json
 import hashlib
 import asyncio
+import sqlite3
+import threading
+from array import array
 from pathlib import Path
 
+import orjson
+
 # 添加项目根目录到 Python 路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -23,10 +28,78 @@ logger = get_logger("house_advisor.scripts.init_kb")
 # 数据目录
 DATA_DIR = Path(__file__).parent.parent / "data" / "knowledge"
 
+# 每次写入 Chroma 的文档数（Chroma 建议 50-250，过大会形成单个超大事务）
+BATCH_SIZE = 200
+
+# 向量缓存文件（按模型和内容哈希缓存，重复导入时跳过 embedding 计算）
+EMBED_CACHE_PATH = Path(__file__).parent.parent / "data" / ".embed_cache" / "embeddings.sqlite3"
+
+# 句子切分：以句末标点或换行结尾（末句可无结束符）
+_SENTENCE_RE = re.compile(r"[^。！？\n]*(?:[。！？]|\n\n|\n|$)")
+
+# 文件名中的城市标识：(拼音, 中文名, 城市)
+CITY_TOKENS = (
+    ("nanning", "南宁", "南宁"),
+    ("liuzhou", "柳州", "柳州"),
+)
+
+
+class EmbeddingCache:
+    """
+    持久化的向量缓存
+    
+    以 sha256(模型标识 + 内容) 为键存储 float32 向量，更换模型后自动失效
+    """
+    
+    def __init__(self, path: Path, model_id: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._model_id = model_id
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+    
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self._model_id}\0{text}".encode("utf-8")).hexdigest()
+    
+    def embed(self, client: ChromaClient, texts: list[str]) -> list[list[float]]:
+        """
+        获取文本向量：命中缓存直接返回，未命中的批量计算后写回缓存
+        """
+        keys = [self._key(text) for text in texts]
+        
+        with self._lock:
+            placeholders = ",".join("?" * len(keys))
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", keys
+            ).fetchall()
+        cached = {key: array("f", blob).tolist() for key, blob in rows}
+        
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        if missing:
+            vectors = client.embed([texts[i] for i in missing])
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(keys[i], array("f", vector).tobytes()) for i, vector in zip(missing, vectors)]
+                )
+                self._conn.commit()
+            for i, vector in zip(missing, vectors):
+                cached[keys[i]] = vector
+        
+        logger.debug(f"向量缓存命中 {len(texts) - len(missing)}/{len(texts)}")
+        return [cached[key] for key in keys]
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
 
 def generate_doc_id(content: str, prefix: str = "") -> str:
     """生成文档ID"""
-    hash_val = hashlib.md5(content.encode()).hexdigest()[:8]
+    hash_val = hashlib.blake2b(content.encode("utf-8"), digest_size=4).hexdigest()
     return f"{prefix}_{hash_val}" if prefix else hash_val
 
 
@@ -45,30 +118,129 @@ def chunk_text(text: str, chunk_size: int = 500, overlap: int = 50) -> list[str]
     if len(text) <= chunk_size:
         return [text]
     
+    # 先一次性切成句子，再贪心地把句子拼成不超过 chunk_size 的块
     chunks = []
-    start = 0
+    buffer = ""
     
-    while start < len(text):
-        end = start + chunk_size
+    for sentence in _SENTENCE_RE.findall(text):
+        if not sentence:
+            continue
         
-        # 尝试在句子边界处分割
-        if end < len(text):
-            # 向后查找句子结束符
-            for sep in ["。", "！", "？", "\n\n", "\n"]:
-                pos = text.rfind(sep, start, end)
-                if pos > start:
-                    end = pos + len(sep)
-                    break
+        if buffer and len(buffer) + len(sentence) > chunk_size:
+            chunk = buffer.strip()
+            if chunk:
+                chunks.append(chunk)
+            # 保留上一块末尾作为重叠；放不下当前句子时不保留
+            buffer = buffer[-overlap:] if overlap else ""
+            if len(buffer) + len(sentence) > chunk_size:
+                buffer = ""
         
-        chunk = text[start:end].strip()
-        if chunk:
-            chunks.append(chunk)
+        buffer += sentence
         
-        start = end - overlap
+        # 单句超长时按 chunk_size 硬切
+        while len(buffer) > chunk_size:
+            chunk = buffer[:chunk_size].strip()
+            if chunk:
+                chunks.append(chunk)
+            buffer = buffer[chunk_size - overlap:]
+    
+    chunk = buffer.strip()
+    if chunk:
+        chunks.append(chunk)
     
     return chunks
 
 
+def _write_batch(
+    client: ChromaClient,
+    collection_name: str,
+    documents: list[str],
+    metadatas: list[dict],
+    ids: list[str],
+    cache: EmbeddingCache | None,
+    is_new: bool = False
+) -> None:
+    """
+    写入一批文档；有缓存时先从缓存取向量
+    
+    is_new 为 True 时批次中的 ID 均不在 Collection 中，直接 add 跳过存在性检查
+    """
+    embeddings = cache.embed(client, documents) if cache else None
+    write = client.add_documents if is_new else client.upsert_documents
+    write(
+        collection_name=collection_name,
+        documents=documents,
+        metadatas=metadatas,
+        ids=ids,
+        embeddings=embeddings
+    )
+
+
+async def sync_documents(
+    client: ChromaClient,
+    collection_name: str,
+    documents: list[str],
+    metadatas: list[dict],
+    ids: list[str],
+    cache: EmbeddingCache | None = None,
+    batch_size: int = BATCH_SIZE
+) -> None:
+    """
+    增量同步文档到 Chroma
+    
+    文档ID由内容哈希生成，ID 相同即内容相同：删除已不存在的ID，
+    只写入新增或元数据有变化的文档，未变化的文档不重新计算向量、不重建索引。
+    Collection 元数据记录了生成向量的 embedding 模型，与当前模型不一致
+    （或旧版本创建、未记录模型）时删除整个 Collection 后全量重建，
+    避免新旧模型的向量混在同一个 Collection 中。
+    写入（含 embedding 计算）是阻塞调用，放到线程池分批执行，
+    使多个知识库的导入可以并发进行
+    """
+    collection_meta = await asyncio.to_thread(client.get_collection_metadata, collection_name)
+    if collection_meta is not None:
+        stored_model = collection_meta.get(ChromaClient.METADATA_EMBEDDING_MODEL)
+        if stored_model != client.embedding_model_id:
+            logger.info(
+                f"{collection_name}: embedding 模型由 {stored_model} 变为 "
+                f"{client.embedding_model_id}，重建 Collection"
+            )
+            await asyncio.to_thread(client.delete_collection, collection_name)
+            if await asyncio.to_thread(client.get_collection_metadata, collection_name) is not None:
+                raise RuntimeError(f"{collection_name}: 删除旧 Collection 失败，无法重建")
+    
+    existing = await asyncio.to_thread(client.get_metadatas, collection_name)
+    
+    current_ids = set(ids)
+    removed = [doc_id for doc_id in existing if doc_id not in current_ids]
+    if removed:
+        await asyncio.to_thread(client.delete_documents, collection_name, removed)
+    
+    # 新增文档用 add，已存在但元数据变化的用 upsert；按ID排序后写入，相邻批次的插入顺序稳定
+    added = sorted((i for i, doc_id in enumerate(ids) if doc_id not in existing), key=ids.__getitem__)
+    updated = sorted(
+        (i for i, doc_id in enumerate(ids) if doc_id in existing and existing[doc_id] != metadatas[i]),
+        key=ids.__getitem__
+    )
+    logger.info(
+        f"{collection_name}: 共 {len(ids)} 个文档，新增 {len(added)} 个，"
+        f"更新 {len(updated)} 个，删除 {len(removed)} 个"
+    )
+    
+    for indices, is_new in ((added, True), (updated, False)):
+        for start in range(0, len(indices), batch_size):
+            batch = indices[start:start + batch_size]
+            await asyncio.to_thread(
+                _write_batch,
+                client,
+                collection_name,
+                [documents[i] for i in batch],
+                [metadatas[i] for i in batch],
+                [ids[i] for i in batch],
+                cache,
+                is_new
+            )
+
+
 def load_markdown_file(file_path: Path) -> tuple[str, dict]:
     """
     加载 Markdown 文件
@@ -76,15 +248,16 @@ def load_markdown_file(file_path: Path) -> tuple[str, dict]:
     Returns:
         (内容, 元数据)
     """
-    content = file_path.read_text(encoding="utf-8")
+    # 一次性读取字节后解码，避免文本模式的逐行缓冲
+    content = file_path.read_bytes().decode("utf-8")
     
     # 从文件名提取城市信息
     filename = file_path.stem.lower()
     city = None
-    if "nanning" in filename or "南宁" in filename:
-        city = "南宁"
-    elif "liuzhou" in filename or "柳州" in filename:
-        city = "柳州"
+    for pinyin, name, city_name in CITY_TOKENS:
+        if pinyin in filename or name in filename:
+            city = city_name
+            break
     
     metadata = {
         "source": file_path.name,
@@ -96,6 +269,64 @@ def load_markdown_file(file_path: Path) -> tuple[str, dict]:
     return content, metadata
 
 
+def prepare_markdown_file(
+    file_path: Path,
+    id_prefix: str,
+    extra_metadata: dict | None = None
+) -> tuple[list[str], list[dict], list[str]]:
+    """
+    读取并分块单个 Markdown 文件
+    
+    Args:
+        file_path: 文件路径
+        id_prefix: 文档ID前缀（如 policy、guide）
+        extra_metadata: 附加到每个块的元数据
+    
+    Returns:
+        (文档块列表, 元数据列表, 文档ID列表)
+    """
+    content, metadata = load_markdown_file(file_path)
+    if extra_metadata:
+        metadata.update(extra_metadata)
+    
+    chunks = chunk_text(content, chunk_size=500)
+    
+    metadatas = [{**metadata, "chunk_index": i} for i in range(len(chunks))]
+    ids = [
+        generate_doc_id(chunk, f"{id_prefix}_{file_path.stem}_{i}")
+        for i, chunk in enumerate(chunks)
+    ]
+    return chunks, metadatas, ids
+
+
+def concat_prepared(
+    prepared: list[tuple[list[str], list[dict], list[str]]]
+) -> tuple[list[str], list[dict], list[str]]:
+    """
+    合并多个文件的分块结果
+    
+    先统计总块数并一次性分配三个列表，再按切片写入，
+    避免在多层循环中反复 append/extend 导致的扩容
+    
+    Returns:
+        (文档块列表, 元数据列表, 文档ID列表)
+    """
+    total = sum(len(docs) for docs, _, _ in prepared)
+    documents: list = [None] * total
+    metadatas: list = [None] * total
+    ids: list = [None] * total
+    
+    pos = 0
+    for docs, metas, doc_ids in prepared:
+        end = pos + len(docs)
+        documents[pos:end] = docs
+        metadatas[pos:end] = metas
+        ids[pos:end] = doc_ids
+        pos = end
+    
+    return documents, metadatas, ids
+
+
 def load_json_file(file_path: Path) -> list[dict]:
     """
     加载 JSON 文件
@@ -103,8 +334,7 @@ def load_json_file(file_path: Path) -> list[dict]:
     Returns:
         数据列表
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(file_path.read_bytes())
     
     if isinstance(data, list):
         return data
@@ -114,49 +344,77 @@ def load_json_file(file_path: Path) -> list[dict]:
         return [data]
 
 
-async def init_policies(client: ChromaClient) -> int:
+def _load_md_corpus(
+    dir_path: Path,
+    id_prefix: str,
+    extra_meta: dict | None = None
+) -> tuple[list[str], list[dict], list[str]]:
     """
-    初始化政策知识库
+    读取目录下所有 Markdown 文件并分块
+    
+    Returns:
+        (文档块列表, 元数据列表, 文档ID列表)
+    """
+    return concat_prepared([
+        prepare_markdown_file(file_path, id_prefix, extra_meta)
+        for file_path in dir_path.glob("*.md")
+    ])
+
+
+async def _init_markdown_collection(
+    client: ChromaClient,
+    cache: EmbeddingCache | None,
+    dir_path: Path,
+    collection_name: str,
+    id_prefix: str,
+    label: str,
+    extra_meta: dict | None = None
+) -> int:
+    """
+    将 Markdown 目录同步到指定 Collection（政策、指南共用）
     
     Returns:
         导入的文档数量
     """
-    logger.info("正在初始化政策知识库...")
+    logger.info(f"正在初始化{label}知识库...")
     
-    policies_dir = DATA_DIR / "policies"
-    if not policies_dir.exists():
-        logger.warning(f"政策目录不存在: {policies_dir}")
+    if not dir_path.exists():
+        logger.warning(f"{label}目录不存在: {dir_path}")
         return 0
     
-    documents = []
-    metadatas = []
-    ids = []
+    documents, metadatas, ids = _load_md_corpus(dir_path, id_prefix, extra_meta)
     
-    for file_path in policies_dir.glob("*.md"):
-        content, metadata = load_markdown_file(file_path)
-        
-        # 分块处理
-        chunks = chunk_text(content, chunk_size=500)
-        
-        for i, chunk in enumerate(chunks):
-            doc_id = generate_doc_id(chunk, f"policy_{file_path.stem}_{i}")
-            documents.append(chunk)
-            metadatas.append({**metadata, "chunk_index": i})
-            ids.append(doc_id)
-    
-    if documents:
-        client.add_documents(
-            collection_name=ChromaClient.COLLECTION_POLICIES,
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
+    await sync_documents(
+        client,
+        collection_name,
+        documents,
+        metadatas,
+        ids,
+        cache
+    )
     
-    logger.info(f"政策知识库初始化完成，共 {len(documents)} 个文档块")
+    logger.info(f"{label}知识库初始化完成，共 {len(documents)} 个文档块")
     return len(documents)
 
 
-async def init_faq(client: ChromaClient) -> int:
+async def init_policies(client: ChromaClient, cache: EmbeddingCache | None = None) -> int:
+    """
+    初始化政策知识库
+    
+    Returns:
+        导入的文档数量
+    """
+    return await _init_markdown_collection(
+        client,
+        cache,
+        DATA_DIR / "policies",
+        ChromaClient.COLLECTION_POLICIES,
+        "policy",
+        "政策"
+    )
+
+
+async def init_faq(client: ChromaClient, cache: EmbeddingCache | None = None) -> int:
     """
     初始化 FAQ 知识库
     
@@ -198,58 +456,35 @@ async def init_faq(client: ChromaClient) -> int:
             })
             ids.append(doc_id)
     
-    if documents:
-        client.add_documents(
-            collection_name=ChromaClient.COLLECTION_FAQ,
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
+    await sync_documents(
+        client,
+        ChromaClient.COLLECTION_FAQ,
+        documents,
+        metadatas,
+        ids,
+        cache
+    )
     
     logger.info(f"FAQ 知识库初始化完成，共 {len(documents)} 个文档")
     return len(documents)
 
 
-async def init_guides(client: ChromaClient) -> int:
+async def init_guides(client: ChromaClient, cache: EmbeddingCache | None = None) -> int:
     """
     初始化购房指南知识库
     
     Returns:
         导入的文档数量
     """
-    logger.info("正在初始化购房指南知识库...")
-    
-    guides_dir = DATA_DIR / "guides"
-    if not guides_dir.exists():
-        logger.warning(f"指南目录不存在: {guides_dir}")
-        return 0
-    
-    documents = []
-    metadatas = []
-    ids = []
-    
-    for file_path in guides_dir.glob("*.md"):
-        content, metadata = load_markdown_file(file_path)
-        
-        # 分块处理
-        chunks = chunk_text(content, chunk_size=500)
-        
-        for i, chunk in enumerate(chunks):
-            doc_id = generate_doc_id(chunk, f"guide_{file_path.stem}_{i}")
-            documents.append(chunk)
-            metadatas.append({**metadata, "chunk_index": i, "type": "guide"})
-            ids.append(doc_id)
-    
-    if documents:
-        client.add_documents(
-            collection_name=ChromaClient.COLLECTION_GUIDES,
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
-    
-    logger.info(f"购房指南知识库初始化完成，共 {len(documents)} 个文档块")
-    return len(documents)
+    return await _init_markdown_collection(
+        client,
+        cache,
+        DATA_DIR / "guides",
+        ChromaClient.COLLECTION_GUIDES,
+        "guide",
+        "购房指南",
+        {"type": "guide"}
+    )
 
 
 async def main():
@@ -283,47 +518,50 @@ async def main():
         embedding_model_path=embedding_model_path
     )
     
+    cache = EmbeddingCache(EMBED_CACHE_PATH, client.embedding_model_id)
+    
     try:
         await client.connect()
         
-        # 清空现有数据（可选）
-        logger.info("清空现有 Collection...")
-        for collection_name in [
-            ChromaClient.COLLECTION_POLICIES,
-            ChromaClient.COLLECTION_FAQ,
-            ChromaClient.COLLECTION_GUIDES
-        ]:
-            try:
-                client.delete_collection(collection_name)
-            except Exception:
-                pass
-        
-        # 初始化各知识库
-        total = 0
-        total += await init_policies(client)
-        total += await init_faq(client)
-        total += await init_guides(client)
+        # 初始化各知识库（目录和 Collection 互不相关，并发导入）
+        counts = await asyncio.gather(
+            init_policies(client, cache),
+            init_faq(client, cache),
+            init_guides(client, cache)
+        )
+        total = sum(counts)
         
         logger.info("=" * 50)
         logger.info(f"知识库初始化完成，共导入 {total} 个文档")
         logger.info("=" * 50)
         
-        # 验证
+        # 验证（并发查询各 Collection 数量）
         logger.info("验证 Collection 状态:")
-        for name in [
+        names = (
             ChromaClient.COLLECTION_POLICIES,
             ChromaClient.COLLECTION_FAQ,
             ChromaClient.COLLECTION_GUIDES
-        ]:
-            count = client.count_documents(name)
+        )
+        doc_counts = await asyncio.gather(
+            *(asyncio.to_thread(client.count_documents, name) for name in names)
+        )
+        for name, count in zip(names, doc_counts):
             logger.info(f"  - {name}: {count} 个文档")
         
     except Exception as e:
         logger.error(f"初始化失败: {e}")
         raise
     finally:
+        cache.close()
         await client.disconnect()
 
 
 if __name__ == "__main__":
+    # 可选：安装了 uvloop 时使用其事件循环，未安装则回退到默认循环
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     asyncio.run(main())
@@ -1,9 +1,17 @@
 # pytest 配置文件
 # 确保工具在所有测试之前被注册
 
+import asyncio
+import os
+
 import pytest
+from pytest_asyncio import is_async_test
+from fastapi.testclient import TestClient
+from hypothesis import settings
+from hypothesis.database import DirectoryBasedExampleDatabase
 
 # 导入工具模块以触发注册（在所有测试之前）
+from app.main import app
 from app.agent.tools import (
     tool_registry,
     CalcLoanTool,
@@ -15,8 +23,61 @@ from app.agent.tools import (
     CompareDistrictsTool,
     JudgeTimingTool,
     SearchPolicyTool,
-    SearchFAQTool
+    SearchFAQTool,
+    get_knowledge_base
+)
+from app.data.loader import get_data_loader
+
+
+# Hypothesis 默认使用 ci 配置：固定随机种子、不读写样例库，统一超时限制；
+# 被测属性都是求和 / 分段类简单函数，复现失败靠固定种子即可，无需样例库。
+# 本地调试可通过 HYPOTHESIS_PROFILE=default 切回 Hypothesis 默认配置；
+# 需要更充分的随机覆盖时使用 HYPOTHESIS_PROFILE=thorough（未单独指定样例数的测试跑 200 例）
+settings.register_profile(
+    "ci",
+    max_examples=50,
+    derandomize=True,
+    database=None,
+    deadline=200,
+    print_blob=False
 )
+settings.register_profile(
+    "thorough",
+    parent=settings.get_profile("ci"),
+    max_examples=200,
+    derandomize=False
+)
+_hypothesis_profile = os.environ.get("HYPOTHESIS_PROFILE", "ci")
+
+# 使用 pytest-xdist 并行运行时（pytest -n auto --dist=loadscope），
+# 启用样例库的配置下每个 worker 使用独立的样例库目录，避免多进程同时读写
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _xdist_worker and settings.get_profile(_hypothesis_profile).database is not None:
+    settings.register_profile(
+        "xdist",
+        parent=settings.get_profile(_hypothesis_profile),
+        database=DirectoryBasedExampleDatabase(f".hypothesis/examples/{_xdist_worker}")
+    )
+    _hypothesis_profile = "xdist"
+settings.load_profile(_hypothesis_profile)
+
+
+def pytest_collection_modifyitems(items):
+    """所有异步测试共用一个会话级事件循环，避免每个用例创建/销毁事件循环"""
+    session_loop_marker = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop_marker, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """异步测试的事件循环策略：安装了 uvloop 时使用 uvloop，否则使用默认策略"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -29,9 +90,80 @@ def ensure_tools_registered():
         "search_policy", "search_faq"
     ]
     
-    registered = [t.name for t in tool_registry.get_all()]
     for tool_name in expected_tools:
-        if tool_name not in registered:
+        if tool_name not in tool_registry:
             raise RuntimeError(f"工具 {tool_name} 未注册")
     
     yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_data_loader():
+    """
+    预加载配置、市场数据和政策知识库
+    
+    每个进程（含 xdist worker）在会话开始时只解析一次数据文件，
+    各测试用例不再承担首次加载的 I/O
+    """
+    loader = get_data_loader()
+    loader.interest_rates
+    loader.tax_rules
+    loader.provident_fund
+    loader.cost_reference
+    for city in loader.get_supported_cities():
+        loader.get_market_data(city)
+    get_knowledge_base()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    整个测试会话共享的 API 测试客户端
+    
+    不进入 TestClient 上下文，不触发 lifespan（计算器接口无需数据库和 Chroma）
+    """
+    return TestClient(app)
+
+
+# 工具实例在整个测试会话中共享（直接复用注册表中的单例，避免每个用例/样例重复构造）
+
+@pytest.fixture(scope="session")
+def registry():
+    """全局工具注册表（会话开始时已完成注册）"""
+    return tool_registry
+
+
+@pytest.fixture(scope="session")
+def calc_loan_tool():
+    """贷款计算工具"""
+    return tool_registry.get("calc_loan")
+
+
+@pytest.fixture(scope="session")
+def calc_tax_tool():
+    """税费计算工具"""
+    return tool_registry.get("calc_tax")
+
+
+@pytest.fixture(scope="session")
+def calc_total_cost_tool():
+    """总成本计算工具"""
+    return tool_registry.get("calc_total_cost")
+
+
+@pytest.fixture(scope="session")
+def assess_pressure_tool():
+    """还款压力评估工具"""
+    return tool_registry.get("assess_pressure")
+
+
+@pytest.fixture(scope="session")
+def search_policy_tool():
+    """政策检索工具"""
+    return tool_registry.get("search_policy")
+
+
+@pytest.fixture(scope="session")
+def search_faq_tool():
+    """FAQ 检索工具"""
+    return tool_registry.get("search_faq")
@@ -2,19 +2,12 @@
 计算器 API 测试
 验证贷款计算、税费计算、总成本计算接口
 """
-import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-
-client = TestClient(app)
 
 
 class TestLoanCalcAPI:
     """贷款计算 API 测试"""
     
-    def test_calc_loan_equal_payment(self):
+    def test_calc_loan_equal_payment(self, client):
         """测试等额本息贷款计算"""
         response = client.post("/api/v1/calc/loan", json={
             "price": 2000000,
@@ -37,7 +30,7 @@ class TestLoanCalcAPI:
         assert result["monthly_payment"] > 0
         assert result["total_interest"] > 0
     
-    def test_calc_loan_equal_principal(self):
+    def test_calc_loan_equal_principal(self, client):
         """测试等额本金贷款计算"""
         response = client.post("/api/v1/calc/loan", json={
             "price": 2000000,
@@ -53,7 +46,7 @@ class TestLoanCalcAPI:
         assert data["data"]["method"] == "equal_principal"
         assert data["data"]["first_month_payment"] > data["data"]["last_month_payment"]
     
-    def test_calc_loan_validation_error(self):
+    def test_calc_loan_validation_error(self, client):
         """测试参数验证错误"""
         response = client.post("/api/v1/calc/loan", json={
             "price": -100,  # 无效价格
@@ -67,7 +60,7 @@ class TestLoanCalcAPI:
         assert data["code"] == 3001
         assert "参数验证错误" in data["message"]
     
-    def test_calc_loan_missing_param(self):
+    def test_calc_loan_missing_param(self, client):
         """测试缺少必需参数"""
         response = client.post("/api/v1/calc/loan", json={
             "price": 2000000
@@ -82,7 +75,7 @@ class TestLoanCalcAPI:
 class TestTaxCalcAPI:
     """税费计算 API 测试"""
     
-    def test_calc_tax_first_home_small(self):
+    def test_calc_tax_first_home_small(self, client):
         """测试首套小面积房税费计算"""
         response = client.post("/api/v1/calc/tax", json={
             "price": 1000000,
@@ -103,7 +96,7 @@ class TestTaxCalcAPI:
         assert result["vat"] == 0
         assert result["vat_exempt"] is True
     
-    def test_calc_tax_second_home_large(self):
+    def test_calc_tax_second_home_large(self, client):
         """测试二套大面积房税费计算"""
         response = client.post("/api/v1/calc/tax", json={
             "price": 2000000,
@@ -127,7 +120,7 @@ class TestTaxCalcAPI:
 class TestTotalCostCalcAPI:
     """总成本计算 API 测试"""
     
-    def test_calc_total_cost_basic(self):
+    def test_calc_total_cost_basic(self, client):
         """测试基本总成本计算"""
         response = client.post("/api/v1/calc/total_cost", json={
             "price": 2000000,
@@ -146,7 +139,7 @@ class TestTotalCostCalcAPI:
         # 总成本 = 房价 + 利息 + 税费
         assert result["total_cost"] == 2550000
     
-    def test_calc_total_cost_with_extras(self):
+    def test_calc_total_cost_with_extras(self, client):
         """测试包含装修等额外费用的总成本计算"""
         response = client.post("/api/v1/calc/total_cost", json={
             "price": 2000000,
@@ -170,7 +163,7 @@ class TestTotalCostCalcAPI:
 class TestAPIResponseFormat:
     """API 响应格式测试"""
     
-    def test_success_response_format(self):
+    def test_success_response_format(self, client):
         """测试成功响应格式"""
         response = client.post("/api/v1/calc/loan", json={
             "price": 1000000,
@@ -187,7 +180,7 @@ class TestAPIResponseFormat:
         assert data["code"] == 0
         assert data["message"] == "success"
     
-    def test_error_response_format(self):
+    def test_error_response_format(self, client):
         """测试错误响应格式"""
         response = client.post("/api/v1/calc/loan", json={
             "price": "invalid"  # 类型错误
@@ -6,14 +6,36 @@ Property 11: API 响应格式一致性
 Property 12: 参数验证错误格式
 验证: 需求 10.5, 11.4
 """
+import asyncio
+
+import httpx
 import pytest
-from hypothesis import given, strategies as st, settings
-from fastapi.testclient import TestClient
+from hypothesis import given, strategies as st, settings, HealthCheck
 
 from app.main import app
 
 
-client = TestClient(app)
+# 每个示例都要走一遍完整的 HTTP 请求链路，响应格式属性 30 个示例已足够；
+# 固定随机种子避免不同运行间结果漂移
+fast_pbt = settings(
+    max_examples=30,
+    derandomize=True,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow]
+)
+
+
+# 批量属性测试：每个示例并发发送 BATCH_SIZE 个请求，示例数相应减少
+BATCH_SIZE = 16
+batch_pbt = settings(fast_pbt, max_examples=4)
+
+
+async def post_all(path: str, payloads: list[dict]) -> list[dict]:
+    """通过 ASGI 并发发送一批请求，返回解析后的响应体"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        responses = await asyncio.gather(*(ac.post(path, json=p) for p in payloads))
+    return [response.json() for response in responses]
 
 
 # ==================== 数据生成策略 ====================
@@ -62,65 +84,62 @@ class TestProperty11ResponseFormatConsistency:
     **验证: 需求 10.5**
     """
     
-    @given(params=valid_loan_params)
-    @settings(max_examples=100)
-    def test_loan_api_response_format(self, params):
+    @pytest.mark.asyncio
+    @given(params_batch=st.lists(valid_loan_params, min_size=BATCH_SIZE, max_size=BATCH_SIZE))
+    @batch_pbt
+    async def test_loan_api_response_format(self, params_batch):
         """
         Feature: agent-core, Property 11: API 响应格式一致性
         对于任意有效的贷款计算参数，响应应包含 code、message、data 三个字段
         """
-        response = client.post("/api/v1/calc/loan", json=params)
-        data = response.json()
-        
-        # 验证响应包含必需字段
-        assert "code" in data, "响应缺少 code 字段"
-        assert "message" in data, "响应缺少 message 字段"
-        assert "data" in data, "响应缺少 data 字段"
-        
-        # 验证成功响应的格式
-        assert data["code"] == 0, f"成功响应的 code 应为 0，实际为 {data['code']}"
-        assert data["message"] == "success", f"成功响应的 message 应为 'success'，实际为 {data['message']}"
-        assert data["data"] is not None, "成功响应的 data 不应为 None"
+        for data in await post_all("/api/v1/calc/loan", params_batch):
+            # 验证响应包含必需字段
+            assert "code" in data, "响应缺少 code 字段"
+            assert "message" in data, "响应缺少 message 字段"
+            assert "data" in data, "响应缺少 data 字段"
+            
+            # 验证成功响应的格式
+            assert data["code"] == 0, f"成功响应的 code 应为 0，实际为 {data['code']}"
+            assert data["message"] == "success", f"成功响应的 message 应为 'success'，实际为 {data['message']}"
+            assert data["data"] is not None, "成功响应的 data 不应为 None"
     
-    @given(params=valid_tax_params)
-    @settings(max_examples=100)
-    def test_tax_api_response_format(self, params):
+    @pytest.mark.asyncio
+    @given(params_batch=st.lists(valid_tax_params, min_size=BATCH_SIZE, max_size=BATCH_SIZE))
+    @batch_pbt
+    async def test_tax_api_response_format(self, params_batch):
         """
         Feature: agent-core, Property 11: API 响应格式一致性
         对于任意有效的税费计算参数，响应应包含 code、message、data 三个字段
         """
-        response = client.post("/api/v1/calc/tax", json=params)
-        data = response.json()
-        
-        # 验证响应包含必需字段
-        assert "code" in data, "响应缺少 code 字段"
-        assert "message" in data, "响应缺少 message 字段"
-        assert "data" in data, "响应缺少 data 字段"
-        
-        # 验证成功响应的格式
-        assert data["code"] == 0
-        assert data["message"] == "success"
-        assert data["data"] is not None
+        for data in await post_all("/api/v1/calc/tax", params_batch):
+            # 验证响应包含必需字段
+            assert "code" in data, "响应缺少 code 字段"
+            assert "message" in data, "响应缺少 message 字段"
+            assert "data" in data, "响应缺少 data 字段"
+            
+            # 验证成功响应的格式
+            assert data["code"] == 0
+            assert data["message"] == "success"
+            assert data["data"] is not None
     
-    @given(params=valid_total_cost_params)
-    @settings(max_examples=100)
-    def test_total_cost_api_response_format(self, params):
+    @pytest.mark.asyncio
+    @given(params_batch=st.lists(valid_total_cost_params, min_size=BATCH_SIZE, max_size=BATCH_SIZE))
+    @batch_pbt
+    async def test_total_cost_api_response_format(self, params_batch):
         """
         Feature: agent-core, Property 11: API 响应格式一致性
         对于任意有效的总成本计算参数，响应应包含 code、message、data 三个字段
         """
-        response = client.post("/api/v1/calc/total_cost", json=params)
-        data = response.json()
-        
-        # 验证响应包含必需字段
-        assert "code" in data, "响应缺少 code 字段"
-        assert "message" in data, "响应缺少 message 字段"
-        assert "data" in data, "响应缺少 data 字段"
-        
-        # 验证成功响应的格式
-        assert data["code"] == 0
-        assert data["message"] == "success"
-        assert data["data"] is not None
+        for data in await post_all("/api/v1/calc/total_cost", params_batch):
+            # 验证响应包含必需字段
+            assert "code" in data, "响应缺少 code 字段"
+            assert "message" in data, "响应缺少 message 字段"
+            assert "data" in data, "响应缺少 data 字段"
+            
+            # 验证成功响应的格式
+            assert data["code"] == 0
+            assert data["message"] == "success"
+            assert data["data"] is not None
 
 
 # ==================== Property 12: 参数验证错误格式 ====================
@@ -134,8 +153,8 @@ class TestProperty12ValidationErrorFormat:
     """
     
     @given(params=invalid_price_params)
-    @settings(max_examples=100)
-    def test_invalid_price_error_format(self, params):
+    @fast_pbt
+    def test_invalid_price_error_format(self, client, params):
         """
         Feature: agent-core, Property 12: 参数验证错误格式
         对于任意无效价格参数，响应应包含非零 code 和说明错误的 message
@@ -155,8 +174,8 @@ class TestProperty12ValidationErrorFormat:
             f"错误消息应说明参数问题，实际为: {data['message']}"
     
     @given(missing_field=st.sampled_from(["price", "down_payment_ratio", "years", "rate"]))
-    @settings(max_examples=100)
-    def test_missing_required_field_error_format(self, missing_field):
+    @fast_pbt
+    def test_missing_required_field_error_format(self, client, missing_field):
         """
         Feature: agent-core, Property 12: 参数验证错误格式
         对于任意缺少必需字段的请求，响应应包含非零 code 和说明缺失字段的 message
@@ -183,8 +202,8 @@ class TestProperty12ValidationErrorFormat:
         assert len(data["message"]) > 0, "错误响应的 message 不应为空"
     
     @given(invalid_type=st.sampled_from(["string", [], {}, None]))
-    @settings(max_examples=100)
-    def test_invalid_type_error_format(self, invalid_type):
+    @fast_pbt
+    def test_invalid_type_error_format(self, client, invalid_type):
         """
         Feature: agent-core, Property 12: 参数验证错误格式
         对于任意类型错误的参数，响应应包含非零 code 和说明错误的 message
@@ -3,12 +3,43 @@
 使用 httpx 处理 SSE 流式响应
 """
 import httpx
-import json
+import orjson
 import asyncio
 import sys
 
 BASE_URL = "http://localhost:8080/api/v1"
 
+# 同时进行的对话请求上限
+MAX_CONCURRENT_CHATS = 2
+
+
+def print_event(event: dict) -> None:
+    """打印单个 SSE 事件"""
+    event_type = event.get("type", "unknown")
+    
+    if event_type == "conversation_created":
+        print(f"[对话创建] ID: {event.get('conversation_id')}")
+    elif event_type == "role_start":
+        print(f"\n[角色开始] {event.get('icon', '')} {event.get('name', '')} ({event.get('role', '')})")
+    elif event_type == "role_result":
+        print(f"\n[角色结果] {event.get('role', '')}:")
+        content = event.get("content", "")
+        # 只打印前500字符
+        if len(content) > 500:
+            print(content[:500] + "...(截断)")
+        else:
+            print(content)
+    elif event_type == "tool_call":
+        print(f"[工具调用] {event.get('tool', '')} - {event.get('args', {})}")
+    elif event_type == "tool_result":
+        print(f"[工具结果] {event.get('tool', '')} - 成功")
+    elif event_type == "error":
+        print(f"[错误] {event.get('code', '')}: {event.get('message', '')}")
+    elif event_type == "done":
+        print("\n[完成]")
+    else:
+        print(f"[{event_type}] {event}")
+
 
 async def test_chat(message: str, session_id: str = "test-session"):
     """测试对话接口"""
@@ -34,37 +65,23 @@ async def test_chat(message: str, session_id: str = "test-session"):
                 print(f"响应头: {dict(response.headers)}")
                 print("\n--- 流式响应 ---\n")
                 
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]  # 去掉 "data: " 前缀
-                        try:
-                            event = json.loads(data)
-                            event_type = event.get("type", "unknown")
-                            
-                            if event_type == "conversation_created":
-                                print(f"[对话创建] ID: {event.get('conversation_id')}")
-                            elif event_type == "role_start":
-                                print(f"\n[角色开始] {event.get('icon', '')} {event.get('name', '')} ({event.get('role', '')})")
-                            elif event_type == "role_result":
-                                print(f"\n[角色结果] {event.get('role', '')}:")
-                                content = event.get("content", "")
-                                # 只打印前500字符
-                                if len(content) > 500:
-                                    print(content[:500] + "...(截断)")
-                                else:
-                                    print(content)
-                            elif event_type == "tool_call":
-                                print(f"[工具调用] {event.get('tool', '')} - {event.get('args', {})}")
-                            elif event_type == "tool_result":
-                                print(f"[工具结果] {event.get('tool', '')} - 成功")
-                            elif event_type == "error":
-                                print(f"[错误] {event.get('code', '')}: {event.get('message', '')}")
-                            elif event_type == "done":
-                                print("\n[完成]")
-                            else:
-                                print(f"[{event_type}] {event}")
-                        except json.JSONDecodeError:
-                            print(f"无法解析: {data}")
+                # 按字节缓冲，以空行（b"\n\n"）切分事件，避免逐行解码
+                buffer = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buffer += chunk
+                    while (end := buffer.find(b"\n\n")) != -1:
+                        raw_event = bytes(buffer[:end])
+                        del buffer[:end + 2]
+                        for line in raw_event.split(b"\n"):
+                            if not line.startswith(b"data: "):
+                                continue
+                            data = line[6:]  # 去掉 "data: " 前缀
+                            try:
+                                event = orjson.loads(data)
+                            except orjson.JSONDecodeError:
+                                print(f"无法解析: {data.decode('utf-8', 'replace')}")
+                                continue
+                            print_event(event)
                             
         print("\n✅ 测试通过")
         return True
@@ -91,12 +108,17 @@ async def main():
         message = " ".join(sys.argv[1:])
         await test_chat(message)
     else:
-        # 运行所有测试
-        results = []
-        for message, session_id in test_cases:
-            result = await test_chat(message, session_id)
-            results.append((message[:20], result))
-            await asyncio.sleep(1)  # 避免请求过快
+        # 并发运行所有测试，用信号量限制同时进行的请求数
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHATS)
+        
+        async def bounded_chat(message: str, session_id: str) -> bool:
+            async with semaphore:
+                return await test_chat(message, session_id)
+        
+        outcomes = await asyncio.gather(
+            *(bounded_chat(message, session_id) for message, session_id in test_cases)
+        )
+        results = [(message[:20], result) for (message, _), result in zip(test_cases, outcomes)]
         
         # 打印汇总
         print("\n" + "="*60)
@@ -108,4 +130,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # 可选：安装了 uvloop 时使用其事件循环，未安装则回退到默认循环
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     asyncio.run(main())
@@ -1,17 +1,11 @@
 # 检查点测试 - 核心模块测试
 # 验证所有工具可以独立执行，Agent 引擎可以处理简单问题
 
-import asyncio
 import pytest
-from typing import Any
 
 # 导入工具（从 __init__.py 导入以触发注册）
 from app.agent.tools import (
     tool_registry,
-    CalcLoanTool,
-    CalcTaxTool,
-    CalcTotalCostTool,
-    AssessPressureTool,
     QueryMarketTool,
     QueryPriceTrendTool,
     CompareDistrictsTool,
@@ -26,9 +20,7 @@ from app.agent.roles import (
     FINANCIAL_ADVISOR,
     POLICY_EXPERT,
     MARKET_ANALYST,
-    PURCHASE_CONSULTANT,
-    get_role,
-    get_all_roles
+    PURCHASE_CONSULTANT
 )
 from app.agent.intent import IntentRecognizer, ExecutionPlan
 
@@ -52,22 +44,20 @@ class TestToolRegistration:
         ]
         
         for tool_name in expected_tools:
-            assert tool_registry.exists(tool_name), f"工具 {tool_name} 未注册"
+            assert tool_name in tool_registry, f"工具 {tool_name} 未注册"
     
     def test_tool_count(self):
         """验证工具总数"""
-        tools = tool_registry.get_all()
-        assert len(tools) >= 10, f"工具数量不足，当前: {len(tools)}"
+        assert len(tool_registry) >= 10, f"工具数量不足，当前: {len(tool_registry)}"
 
 
 class TestFinancialToolsExecution:
     """测试财务计算工具独立执行"""
     
     @pytest.mark.asyncio
-    async def test_calc_loan_equal_payment(self):
+    async def test_calc_loan_equal_payment(self, calc_loan_tool):
         """测试等额本息贷款计算"""
-        tool = CalcLoanTool()
-        result = await tool.execute(
+        result = await calc_loan_tool.execute(
             price=1000000,  # 100万
             down_payment_ratio=0.3,  # 30%首付
             years=30,
@@ -88,10 +78,9 @@ class TestFinancialToolsExecution:
         assert result["method"] == "equal_payment"
     
     @pytest.mark.asyncio
-    async def test_calc_loan_equal_principal(self):
+    async def test_calc_loan_equal_principal(self, calc_loan_tool):
         """测试等额本金贷款计算"""
-        tool = CalcLoanTool()
-        result = await tool.execute(
+        result = await calc_loan_tool.execute(
             price=1000000,
             down_payment_ratio=0.3,
             years=30,
@@ -103,10 +92,9 @@ class TestFinancialToolsExecution:
         assert result["first_month_payment"] > result["last_month_payment"]
     
     @pytest.mark.asyncio
-    async def test_calc_tax_first_home_small(self):
+    async def test_calc_tax_first_home_small(self, calc_tax_tool):
         """测试首套小面积房税费计算"""
-        tool = CalcTaxTool()
-        result = await tool.execute(
+        result = await calc_tax_tool.execute(
             price=1000000,
             area=85,  # 小于90平
             is_first_home=True,
@@ -125,10 +113,9 @@ class TestFinancialToolsExecution:
         assert result["vat"] == 0
     
     @pytest.mark.asyncio
-    async def test_calc_tax_second_home_large(self):
+    async def test_calc_tax_second_home_large(self, calc_tax_tool):
         """测试二套大面积房税费计算"""
-        tool = CalcTaxTool()
-        result = await tool.execute(
+        result = await calc_tax_tool.execute(
             price=2000000,
             area=120,  # 大于90平
             is_first_home=False,
@@ -141,10 +128,9 @@ class TestFinancialToolsExecution:
         assert result["vat"] > 0
     
     @pytest.mark.asyncio
-    async def test_calc_total_cost(self):
+    async def test_calc_total_cost(self, calc_total_cost_tool):
         """测试总成本计算"""
-        tool = CalcTotalCostTool()
-        result = await tool.execute(
+        result = await calc_total_cost_tool.execute(
             price=1000000,
             down_payment=300000,
             total_interest=500000,
@@ -162,10 +148,9 @@ class TestFinancialToolsExecution:
         assert result["total_cost"] == expected_total
     
     @pytest.mark.asyncio
-    async def test_assess_pressure_low(self):
+    async def test_assess_pressure_low(self, assess_pressure_tool):
         """测试低压力评估"""
-        tool = AssessPressureTool()
-        result = await tool.execute(
+        result = await assess_pressure_tool.execute(
             monthly_payment=3000,
             monthly_income=15000  # 月供占比20%
         )
@@ -174,10 +159,9 @@ class TestFinancialToolsExecution:
         assert result["payment_ratio"] == 20.0
     
     @pytest.mark.asyncio
-    async def test_assess_pressure_medium(self):
+    async def test_assess_pressure_medium(self, assess_pressure_tool):
         """测试中压力评估"""
-        tool = AssessPressureTool()
-        result = await tool.execute(
+        result = await assess_pressure_tool.execute(
             monthly_payment=6000,
             monthly_income=15000  # 月供占比40%
         )
@@ -185,10 +169,9 @@ class TestFinancialToolsExecution:
         assert result["level"] == "medium"
     
     @pytest.mark.asyncio
-    async def test_assess_pressure_high(self):
+    async def test_assess_pressure_high(self, assess_pressure_tool):
         """测试高压力评估"""
-        tool = AssessPressureTool()
-        result = await tool.execute(
+        result = await assess_pressure_tool.execute(
             monthly_payment=9000,
             monthly_income=15000  # 月供占比60%
         )
@@ -331,10 +314,9 @@ class TestPolicyToolsExecution:
 class TestToolSchemaGeneration:
     """测试工具 Schema 生成"""
     
-    def test_tool_schema_format(self):
+    def test_tool_schema_format(self, calc_loan_tool):
         """验证工具 Schema 格式正确"""
-        tool = CalcLoanTool()
-        schema = tool.to_openai_schema()
+        schema = calc_loan_tool.to_openai_schema()
         
         assert schema["type"] == "function"
         assert "function" in schema
@@ -420,33 +402,32 @@ class TestIntentRecognitionBasic:
         assert len(plan.roles) >= 1
         assert isinstance(plan, ExecutionPlan)
     
-    @pytest.mark.asyncio
-    async def test_execution_plan_multi_role(self):
-        """测试多角色执行计划"""
-        plan = await self.recognizer.plan_execution(
-            "公积金贷款月供怎么算",
-            candidate_roles=[POLICY_EXPERT, FINANCIAL_ADVISOR]
+    def test_execution_plan_multi_role(self):
+        """测试多角色执行计划（解析 LLM 返回的 DAG）"""
+        plan = self.recognizer._parse_plan_response(
+            '{"nodes": ['
+            '{"role_id": "policy_expert", "depends_on": []}, '
+            '{"role_id": "financial_advisor", "depends_on": ["policy_expert"]}'
+            '], "reason": "先查公积金政策再算月供"}'
         )
-        assert len(plan.roles) == 2
+        assert plan.roles == [POLICY_EXPERT, FINANCIAL_ADVISOR]
 
 
 class TestToolParameterValidation:
     """测试工具参数验证"""
     
     @pytest.mark.asyncio
-    async def test_missing_required_param(self):
+    async def test_missing_required_param(self, calc_loan_tool):
         """测试缺少必需参数"""
-        tool = CalcLoanTool()
         with pytest.raises(ValueError) as exc_info:
-            await tool.execute(price=1000000)  # 缺少其他必需参数
+            await calc_loan_tool.execute(price=1000000)  # 缺少其他必需参数
         assert "缺少必需参数" in str(exc_info.value)
     
     @pytest.mark.asyncio
-    async def test_invalid_param_type(self):
+    async def test_invalid_param_type(self, calc_loan_tool):
         """测试参数类型错误"""
-        tool = CalcLoanTool()
         with pytest.raises(ValueError) as exc_info:
-            await tool.execute(
+            await calc_loan_tool.execute(
                 price="not a number",  # 应该是数字
                 down_payment_ratio=0.3,
                 years=30,
@@ -1,7 +1,12 @@
 # DataLoader 单元测试
 # 测试数据加载、缓存、热更新功能
 
+import os
+import shutil
+from pathlib import Path
+
 import pytest
+
 from app.data.loader import DataLoader, get_data_loader
 
 
@@ -174,23 +179,54 @@ class TestCaching:
         assert data1 is data2
 
 
+def _touch(path: Path) -> None:
+    """把文件修改时间推后 1 秒，确保与已记录的时间不同"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def isolated_loader(tmp_path) -> DataLoader:
+    """
+    指向临时数据目录副本的独立 DataLoader（不经过单例，不影响全局缓存）
+    
+    热更新测试需要修改文件的修改时间，只能作用在副本上，不能改动仓库中的数据文件
+    """
+    source_dir = get_data_loader()._data_dir
+    for sub in ("config", "market"):
+        shutil.copytree(source_dir / sub, tmp_path / sub)
+    
+    loader = object.__new__(DataLoader)
+    loader._initialized = False
+    loader.__init__()
+    loader._data_dir = tmp_path
+    return loader
+
+
 class TestReload:
     """测试热更新功能"""
     
-    def test_reload_clears_cache(self):
+    def test_reload_clears_cache(self, isolated_loader: DataLoader):
         """测试 reload 清除缓存"""
-        loader = get_data_loader()
+        loader = isolated_loader
         
         # 先加载数据
         _ = loader.interest_rates
+        _ = loader.tax_rules
         _ = loader.get_market_data("南宁")
         
-        # 重新加载
+        # 修改源文件（临时副本）的修改时间后重新加载（只有变化的文件才会清除缓存）
+        data_dir = loader._data_dir
+        _touch(data_dir / "config" / "interest_rates.json")
+        _touch(data_dir / "market" / "nanning.json")
         loader.reload()
         
         # 验证缓存被清除（内部属性为 None）
         assert loader._interest_rates is None
-        assert len(loader._market_data) == 0
+        assert "南宁" not in loader._market_data
+        
+        # 未修改的文件保留缓存
+        assert loader._tax_rules is not None
 
 
 class TestValidation:
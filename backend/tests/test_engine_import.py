@@ -1,11 +1,8 @@
 # 测试 engine 模块导入
-import sys
-sys.path.insert(0, '.')
+import importlib
 
-try:
-    from app.agent.engine import AgentEngine
-    print("AgentEngine 导入成功")
-except Exception as e:
-    print(f"导入失败: {e}")
-    import traceback
-    traceback.print_exc()
+
+def test_engine_importable():
+    """AgentEngine 可以正常导入"""
+    module = importlib.import_module("app.agent.engine")
+    assert hasattr(module, "AgentEngine")
@@ -6,45 +6,96 @@
 # 验证: 需求 3.1, 3.3, 3.4, 3.5
 
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, example, strategies as st, settings, Phase, HealthCheck
 import math
-import asyncio
 
-from app.agent.tools.financial import (
-    CalcLoanTool,
-    CalcTaxTool,
-    CalcTotalCostTool,
-    AssessPressureTool
-)
+from app.agent.tools.financial import _equal_payment
 
 
 # ============================================================
 # 数据生成策略
 # ============================================================
 
+# 金额类策略使用 32 位浮点、不含次正规数：代码按分四舍五入，64 位浮点的极端取值只会拖慢生成和收缩
+# （比例类边界如 0.3 无法用 32 位浮点精确表示，保持默认精度）
+
 # 有效的房价范围（10万 - 5000万）
-price_strategy = st.floats(min_value=100000, max_value=50000000, allow_nan=False, allow_infinity=False)
+price_strategy = st.floats(min_value=100000, max_value=50000000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32)
 
 # 有效的首付比例（10% - 90%）
 down_payment_ratio_strategy = st.floats(min_value=0.1, max_value=0.9, allow_nan=False, allow_infinity=False)
 
-# 有效的贷款年限（1 - 30年）
-years_strategy = st.integers(min_value=1, max_value=30)
+# 有效的贷款年限（1 - 30年，取常见年限）
+years_strategy = st.sampled_from([1, 3, 5, 10, 15, 20, 25, 30])
 
 # 有效的年利率（0.1% - 20%，避免零利率的特殊情况）
 rate_strategy = st.floats(min_value=0.1, max_value=20, allow_nan=False, allow_infinity=False)
 
 # 有效的面积（10 - 1000 平方米）
-area_strategy = st.floats(min_value=10, max_value=1000, allow_nan=False, allow_infinity=False)
+area_strategy = st.floats(min_value=10, max_value=1000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32)
+
+# 契税面积分档（以 90㎡ 为界），显式包含边界值，少量样例即可覆盖分支边界
+small_area_strategy = st.one_of(
+    st.sampled_from([89.99, 90.0]),
+    st.floats(min_value=10, max_value=90, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32)
+)
+large_area_strategy = st.one_of(
+    st.sampled_from([90.01]),
+    st.floats(min_value=90.01, max_value=1000, allow_nan=False, allow_infinity=False)
+)
 
 # 房龄（0 - 50年）
 house_age_strategy = st.integers(min_value=0, max_value=50)
 
 # 月收入（1000 - 1000000）
-monthly_income_strategy = st.floats(min_value=1000, max_value=1000000, allow_nan=False, allow_infinity=False)
+monthly_income_strategy = st.floats(min_value=1000, max_value=1000000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32)
 
 # 月供（100 - 500000）
-monthly_payment_strategy = st.floats(min_value=100, max_value=500000, allow_nan=False, allow_infinity=False)
+monthly_payment_strategy = st.floats(min_value=100, max_value=500000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32)
+
+# 贷款参数（组合策略在模块加载时构建一次，各测试共用）
+loan_params = st.fixed_dictionaries({
+    "price": price_strategy,
+    "down_payment_ratio": down_payment_ratio_strategy,
+    "years": years_strategy,
+    "rate": rate_strategy
+})
+
+# 批量贷款参数：每个示例一次生成一批，示例数相应减少
+loan_params_batch_strategy = st.lists(loan_params, min_size=16, max_size=64)
+
+
+@st.composite
+def price_and_down(draw):
+    """房价与首付：首付直接在 [1万, min(房价, 1000万)] 内生成，避免 assume 过滤丢弃示例"""
+    price = draw(price_strategy)
+    down_payment = draw(st.floats(
+        min_value=10000, max_value=min(price, 10000000),
+        allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32
+    ))
+    return price, down_payment
+
+
+@st.composite
+def payment_income_pair(draw, min_ratio_bp: int, max_ratio_bp: int):
+    """
+    月供与月收入：以整数元和万分比构造，月供 = 收入 × 万分比（向下取整）
+    
+    不经过"收入 × 比例"的浮点乘法再由工具相除，压力分级边界（30%/50%）不会被舍入误差跨越
+    """
+    monthly_income = draw(st.integers(min_value=1000, max_value=1000000))
+    ratio_bp = draw(st.integers(min_value=min_ratio_bp, max_value=max_ratio_bp))
+    return monthly_income * ratio_bp // 10000, monthly_income
+
+
+# 线性求和 / 单调分级类属性：关闭耗时的 explain 阶段，保留超时保护
+sum_pbt = settings(
+    max_examples=30,
+    deadline=500,
+    phases=(Phase.explicit, Phase.reuse, Phase.generate, Phase.shrink),
+    suppress_health_check=[HealthCheck.too_slow]
+)
+pressure_pbt = settings(sum_pbt, max_examples=20)
 
 
 # ============================================================
@@ -62,86 +113,90 @@ class TestProperty4LoanCalculation:
     **验证: 需求 3.1**
     """
     
-    @given(
-        price=price_strategy,
-        down_payment_ratio=down_payment_ratio_strategy,
-        years=years_strategy,
-        rate=rate_strategy
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_equal_payment_formula(self, price, down_payment_ratio, years, rate):
+    def _run_loan_batch(self, calc_loan_tool, batch) -> list[dict]:
+        """同步执行整批等额本息计算（参数由策略生成，跳过通用校验）"""
+        return [
+            calc_loan_tool.execute_validated(**params, method="equal_payment")
+            for params in batch
+        ]
+    
+    @given(batch=loan_params_batch_strategy)
+    @settings(max_examples=20)
+    def test_equal_payment_formula(self, calc_loan_tool, batch):
         """
         **Feature: agent-core, Property 4: 贷款计算数学正确性**
         **Validates: Requirements 3.1**
         
         对于任意有效的贷款参数，等额本息月供应满足标准公式
         """
-        # 创建工具实例
-        loan_tool = CalcLoanTool()
-        
-        # 执行贷款计算
-        result = asyncio.get_event_loop().run_until_complete(
-            loan_tool.execute(
-                price=price,
-                down_payment_ratio=down_payment_ratio,
-                years=years,
-                rate=rate,
-                method="equal_payment"
-            )
-        )
-        
-        # 计算预期值
-        loan_amount = price * (1 - down_payment_ratio)
-        monthly_rate = rate / 100 / 12
-        months = years * 12
-        
-        # 使用标准公式计算预期月供
-        power = (1 + monthly_rate) ** months
-        expected_monthly = loan_amount * monthly_rate * power / (power - 1)
-        
-        # 验证月供（允许 0.01 元误差，因为四舍五入）
-        assert abs(result["monthly_payment"] - round(expected_monthly, 2)) < 0.02, \
-            f"月供计算不正确: 预期 {round(expected_monthly, 2)}, 实际 {result['monthly_payment']}"
-        
-        # 验证首付金额
-        expected_down_payment = price * down_payment_ratio
-        assert abs(result["down_payment"] - round(expected_down_payment, 2)) < 0.02, \
-            f"首付计算不正确: 预期 {round(expected_down_payment, 2)}, 实际 {result['down_payment']}"
+        results = self._run_loan_batch(calc_loan_tool, batch)
+        
+        for params, result in zip(batch, results):
+            price = params["price"]
+            down_payment_ratio = params["down_payment_ratio"]
+            
+            # 计算预期值
+            loan_amount = price * (1 - down_payment_ratio)
+            monthly_rate = params["rate"] / 100 / 12
+            months = params["years"] * 12
+            
+            # 使用标准公式计算预期月供
+            power = (1 + monthly_rate) ** months
+            expected_monthly = loan_amount * monthly_rate * power / (power - 1)
+            
+            # 验证月供（允许 0.01 元误差，因为四舍五入）
+            assert abs(result["monthly_payment"] - round(expected_monthly, 2)) < 0.02, \
+                f"月供计算不正确: 预期 {round(expected_monthly, 2)}, 实际 {result['monthly_payment']}"
+            
+            # 验证首付金额
+            expected_down_payment = price * down_payment_ratio
+            assert abs(result["down_payment"] - round(expected_down_payment, 2)) < 0.02, \
+                f"首付计算不正确: 预期 {round(expected_down_payment, 2)}, 实际 {result['down_payment']}"
+            
+            # 验证贷款金额
+            assert abs(result["loan_amount"] - round(loan_amount, 2)) < 0.02, \
+                f"贷款金额计算不正确: 预期 {round(loan_amount, 2)}, 实际 {result['loan_amount']}"
+    
+    @given(batch=loan_params_batch_strategy)
+    @settings(max_examples=20)
+    def test_total_interest_consistency(self, calc_loan_tool, batch):
+        """
+        **Feature: agent-core, Property 4: 贷款计算数学正确性**
+        **Validates: Requirements 3.1**
         
-        # 验证贷款金额
-        assert abs(result["loan_amount"] - round(loan_amount, 2)) < 0.02, \
-            f"贷款金额计算不正确: 预期 {round(loan_amount, 2)}, 实际 {result['loan_amount']}"
+        对于任意贷款参数，总利息 = 还款总额 - 贷款金额
+        """
+        for result in self._run_loan_batch(calc_loan_tool, batch):
+            # 验证总利息 = 还款总额 - 贷款金额
+            expected_interest = result["total_payment"] - result["loan_amount"]
+            assert abs(result["total_interest"] - expected_interest) < 0.02, \
+                f"总利息计算不一致: 预期 {expected_interest}, 实际 {result['total_interest']}"
     
     @given(
-        price=price_strategy,
-        down_payment_ratio=down_payment_ratio_strategy,
+        loan_amount=price_strategy,
         years=years_strategy,
         rate=rate_strategy
     )
-    @settings(max_examples=100, deadline=None)
-    def test_total_interest_consistency(self, price, down_payment_ratio, years, rate):
+    @settings(max_examples=1000)
+    def test_equal_payment_kernel(self, loan_amount, years, rate):
         """
         **Feature: agent-core, Property 4: 贷款计算数学正确性**
         **Validates: Requirements 3.1**
         
-        对于任意贷款参数，总利息 = 还款总额 - 贷款金额
+        等额本息核心计算为同步纯函数，无需经过异步工具即可大量验证公式
         """
-        loan_tool = CalcLoanTool()
+        monthly_rate = rate / 100 / 12
+        months = years * 12
         
-        result = asyncio.get_event_loop().run_until_complete(
-            loan_tool.execute(
-                price=price,
-                down_payment_ratio=down_payment_ratio,
-                years=years,
-                rate=rate,
-                method="equal_payment"
-            )
-        )
+        monthly_payment, total_payment = _equal_payment(loan_amount, monthly_rate, months)
+        
+        power = (1 + monthly_rate) ** months
+        expected_monthly = loan_amount * monthly_rate * power / (power - 1)
         
-        # 验证总利息 = 还款总额 - 贷款金额
-        expected_interest = result["total_payment"] - result["loan_amount"]
-        assert abs(result["total_interest"] - expected_interest) < 0.02, \
-            f"总利息计算不一致: 预期 {expected_interest}, 实际 {result['total_interest']}"
+        assert math.isclose(monthly_payment, expected_monthly, rel_tol=1e-9), \
+            f"月供计算不正确: 预期 {expected_monthly}, 实际 {monthly_payment}"
+        assert math.isclose(total_payment, monthly_payment * months, rel_tol=1e-9), \
+            f"还款总额不一致: 预期 {monthly_payment * months}, 实际 {total_payment}"
 
 
 # ============================================================
@@ -162,121 +217,41 @@ class TestProperty5TaxCalculation:
     **验证: 需求 3.3**
     """
     
-    @given(
-        price=price_strategy,
-        area=st.floats(min_value=10, max_value=90, allow_nan=False, allow_infinity=False)
+    @pytest.mark.parametrize(
+        "is_first_home, area_strategy, expected_rate, label",
+        [
+            (True, small_area_strategy, 0.01, "首套小面积"),
+            (True, large_area_strategy, 0.015, "首套大面积"),
+            (False, small_area_strategy, 0.01, "二套小面积"),
+            (False, large_area_strategy, 0.02, "二套大面积"),
+        ],
+        ids=["first_small", "first_large", "second_small", "second_large"]
     )
-    @settings(max_examples=100, deadline=None)
-    def test_deed_tax_first_home_small_area(self, price, area):
-        """
-        **Feature: agent-core, Property 5: 税费计算规则正确性**
-        **Validates: Requirements 3.3**
-        
-        首套且面积≤90㎡：契税 = 房价 × 1%
-        """
-        tax_tool = CalcTaxTool()
-        
-        result = asyncio.get_event_loop().run_until_complete(
-            tax_tool.execute(
-                price=price,
-                area=area,
-                is_first_home=True,
-                house_age_years=0
-            )
-        )
-        
-        expected_deed_tax = price * 0.01
-        assert abs(result["deed_tax"] - round(expected_deed_tax, 2)) < 0.02, \
-            f"首套小面积契税计算错误: 预期 {round(expected_deed_tax, 2)}, 实际 {result['deed_tax']}"
-        assert result["deed_tax_rate"] == 0.01, \
-            f"契税税率应为 1%, 实际 {result['deed_tax_rate']}"
-    
-    @given(
-        price=price_strategy,
-        area=st.floats(min_value=90.01, max_value=1000, allow_nan=False, allow_infinity=False)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_deed_tax_first_home_large_area(self, price, area):
-        """
-        **Feature: agent-core, Property 5: 税费计算规则正确性**
-        **Validates: Requirements 3.3**
-        
-        首套且面积>90㎡：契税 = 房价 × 1.5%
-        """
-        tax_tool = CalcTaxTool()
-        
-        result = asyncio.get_event_loop().run_until_complete(
-            tax_tool.execute(
-                price=price,
-                area=area,
-                is_first_home=True,
-                house_age_years=0
-            )
-        )
-        
-        expected_deed_tax = price * 0.015
-        assert abs(result["deed_tax"] - round(expected_deed_tax, 2)) < 0.02, \
-            f"首套大面积契税计算错误: 预期 {round(expected_deed_tax, 2)}, 实际 {result['deed_tax']}"
-        assert result["deed_tax_rate"] == 0.015, \
-            f"契税税率应为 1.5%, 实际 {result['deed_tax_rate']}"
-    
-    @given(
-        price=price_strategy,
-        area=st.floats(min_value=10, max_value=90, allow_nan=False, allow_infinity=False)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_deed_tax_second_home_small_area(self, price, area):
-        """
-        **Feature: agent-core, Property 5: 税费计算规则正确性**
-        **Validates: Requirements 3.3**
-        
-        二套且面积≤90㎡：契税 = 房价 × 1%
-        """
-        tax_tool = CalcTaxTool()
-        
-        result = asyncio.get_event_loop().run_until_complete(
-            tax_tool.execute(
-                price=price,
-                area=area,
-                is_first_home=False,
-                house_age_years=0
-            )
-        )
-        
-        expected_deed_tax = price * 0.01
-        assert abs(result["deed_tax"] - round(expected_deed_tax, 2)) < 0.02, \
-            f"二套小面积契税计算错误: 预期 {round(expected_deed_tax, 2)}, 实际 {result['deed_tax']}"
-        assert result["deed_tax_rate"] == 0.01, \
-            f"契税税率应为 1%, 实际 {result['deed_tax_rate']}"
-    
-    @given(
-        price=price_strategy,
-        area=st.floats(min_value=90.01, max_value=1000, allow_nan=False, allow_infinity=False)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_deed_tax_second_home_large_area(self, price, area):
+    @given(price=price_strategy, data=st.data())
+    @settings(max_examples=30)
+    def test_deed_tax(
+        self, calc_tax_tool, price, data,
+        is_first_home, area_strategy, expected_rate, label
+    ):
         """
         **Feature: agent-core, Property 5: 税费计算规则正确性**
         **Validates: Requirements 3.3**
         
-        二套且面积>90㎡：契税 = 房价 × 2%
+        契税 = 房价 × 对应档位税率（首套/二套 × 面积是否大于90㎡）
         """
-        tax_tool = CalcTaxTool()
-        
-        result = asyncio.get_event_loop().run_until_complete(
-            tax_tool.execute(
-                price=price,
-                area=area,
-                is_first_home=False,
-                house_age_years=0
-            )
+        area = data.draw(area_strategy, label="area")
+        result = calc_tax_tool.execute_sync(
+            price=price,
+            area=area,
+            is_first_home=is_first_home,
+            house_age_years=0
         )
         
-        expected_deed_tax = price * 0.02
+        expected_deed_tax = price * expected_rate
         assert abs(result["deed_tax"] - round(expected_deed_tax, 2)) < 0.02, \
-            f"二套大面积契税计算错误: 预期 {round(expected_deed_tax, 2)}, 实际 {result['deed_tax']}"
-        assert result["deed_tax_rate"] == 0.02, \
-            f"契税税率应为 2%, 实际 {result['deed_tax_rate']}"
+            f"{label}契税计算错误: 预期 {round(expected_deed_tax, 2)}, 实际 {result['deed_tax']}"
+        assert result["deed_tax_rate"] == expected_rate, \
+            f"契税税率应为 {expected_rate:.1%}, 实际 {result['deed_tax_rate']}"
 
 
 # ============================================================
@@ -294,17 +269,20 @@ class TestProperty6TotalCostCalculation:
     """
     
     @given(
-        price=price_strategy,
-        down_payment=st.floats(min_value=10000, max_value=10000000, allow_nan=False, allow_infinity=False),
-        total_interest=st.floats(min_value=0, max_value=10000000, allow_nan=False, allow_infinity=False),
-        taxes=st.floats(min_value=0, max_value=1000000, allow_nan=False, allow_infinity=False),
-        decoration=st.floats(min_value=0, max_value=1000000, allow_nan=False, allow_infinity=False),
-        furniture=st.floats(min_value=0, max_value=500000, allow_nan=False, allow_infinity=False),
-        other_fees=st.floats(min_value=0, max_value=100000, allow_nan=False, allow_infinity=False)
+        price_down=price_and_down(),
+        total_interest=st.floats(min_value=0, max_value=10000000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32),
+        taxes=st.floats(min_value=0, max_value=1000000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32),
+        decoration=st.floats(min_value=0, max_value=1000000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32),
+        furniture=st.floats(min_value=0, max_value=500000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32),
+        other_fees=st.floats(min_value=0, max_value=100000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32)
+    )
+    @example(
+        price_down=(1_000_000, 300_000), total_interest=0, taxes=0,
+        decoration=0, furniture=0, other_fees=0
     )
-    @settings(max_examples=100, deadline=None)
+    @sum_pbt
     def test_total_cost_sum(
-        self, price, down_payment, total_interest, 
+        self, calc_total_cost_tool, price_down, total_interest, 
         taxes, decoration, furniture, other_fees
     ):
         """
@@ -313,42 +291,40 @@ class TestProperty6TotalCostCalculation:
         
         对于任意购房成本组成，总成本 = 房价 + 贷款利息 + 税费 + 装修 + 家具 + 其他
         """
-        # 确保首付不超过房价
-        assume(down_payment <= price)
-        
-        total_cost_tool = CalcTotalCostTool()
-        
-        result = asyncio.get_event_loop().run_until_complete(
-            total_cost_tool.execute(
-                price=price,
-                down_payment=down_payment,
-                total_interest=total_interest,
-                taxes=taxes,
-                decoration=decoration,
-                furniture=furniture,
-                other_fees=other_fees
-            )
+        price, down_payment = price_down
+        
+        result = calc_total_cost_tool.execute_sync(
+            price=price,
+            down_payment=down_payment,
+            total_interest=total_interest,
+            taxes=taxes,
+            decoration=decoration,
+            furniture=furniture,
+            other_fees=other_fees
         )
         
         # 计算预期总成本
-        expected_total = price + total_interest + taxes + decoration + furniture + other_fees
+        expected_total = math.fsum([price, total_interest, taxes, decoration, furniture, other_fees])
         
         # 验证总成本
-        assert abs(result["total_cost"] - round(expected_total, 2)) < 0.02, \
+        assert abs(result["total_cost"] - round(expected_total, 2)) < 0.01, \
             f"总成本计算错误: 预期 {round(expected_total, 2)}, 实际 {result['total_cost']}"
     
     @given(
-        price=price_strategy,
-        down_payment=st.floats(min_value=10000, max_value=10000000, allow_nan=False, allow_infinity=False),
-        total_interest=st.floats(min_value=0, max_value=10000000, allow_nan=False, allow_infinity=False),
-        taxes=st.floats(min_value=0, max_value=1000000, allow_nan=False, allow_infinity=False),
-        decoration=st.floats(min_value=0, max_value=1000000, allow_nan=False, allow_infinity=False),
-        furniture=st.floats(min_value=0, max_value=500000, allow_nan=False, allow_infinity=False),
-        other_fees=st.floats(min_value=0, max_value=100000, allow_nan=False, allow_infinity=False)
+        price_down=price_and_down(),
+        total_interest=st.floats(min_value=0, max_value=10000000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32),
+        taxes=st.floats(min_value=0, max_value=1000000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32),
+        decoration=st.floats(min_value=0, max_value=1000000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32),
+        furniture=st.floats(min_value=0, max_value=500000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32),
+        other_fees=st.floats(min_value=0, max_value=100000, allow_nan=False, allow_infinity=False, allow_subnormal=False, width=32)
+    )
+    @example(
+        price_down=(1_000_000, 300_000), total_interest=0, taxes=0,
+        decoration=0, furniture=0, other_fees=0
     )
-    @settings(max_examples=100, deadline=None)
+    @sum_pbt
     def test_initial_cost_sum(
-        self, price, down_payment, total_interest,
+        self, calc_total_cost_tool, price_down, total_interest,
         taxes, decoration, furniture, other_fees
     ):
         """
@@ -357,27 +333,23 @@ class TestProperty6TotalCostCalculation:
         
         对于任意购房成本组成，初期投入 = 首付 + 税费 + 装修 + 家具 + 其他
         """
-        assume(down_payment <= price)
-        
-        total_cost_tool = CalcTotalCostTool()
-        
-        result = asyncio.get_event_loop().run_until_complete(
-            total_cost_tool.execute(
-                price=price,
-                down_payment=down_payment,
-                total_interest=total_interest,
-                taxes=taxes,
-                decoration=decoration,
-                furniture=furniture,
-                other_fees=other_fees
-            )
+        price, down_payment = price_down
+        
+        result = calc_total_cost_tool.execute_sync(
+            price=price,
+            down_payment=down_payment,
+            total_interest=total_interest,
+            taxes=taxes,
+            decoration=decoration,
+            furniture=furniture,
+            other_fees=other_fees
         )
         
         # 计算预期初期投入
-        expected_initial = down_payment + taxes + decoration + furniture + other_fees
+        expected_initial = math.fsum([down_payment, taxes, decoration, furniture, other_fees])
         
         # 验证初期投入
-        assert abs(result["initial_cost"] - round(expected_initial, 2)) < 0.02, \
+        assert abs(result["initial_cost"] - round(expected_initial, 2)) < 0.01, \
             f"初期投入计算错误: 预期 {round(expected_initial, 2)}, 实际 {result['initial_cost']}"
 
 
@@ -398,84 +370,66 @@ class TestProperty7PressureAssessment:
     **验证: 需求 3.5**
     """
     
-    @given(
-        monthly_income=monthly_income_strategy,
-        ratio=st.floats(min_value=0.01, max_value=0.30, allow_nan=False, allow_infinity=False)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_low_pressure_level(self, monthly_income, ratio):
+    @given(payment_income=payment_income_pair(100, 3000))
+    @pressure_pbt
+    def test_low_pressure_level(self, assess_pressure_tool, payment_income):
         """
         **Feature: agent-core, Property 7: 还款压力等级划分**
         **Validates: Requirements 3.5**
         
         月供/收入 ≤ 30%：应返回低压力等级
         """
-        monthly_payment = monthly_income * ratio
-        pressure_tool = AssessPressureTool()
+        monthly_payment, monthly_income = payment_income
         
-        result = asyncio.get_event_loop().run_until_complete(
-            pressure_tool.execute(
-                monthly_payment=monthly_payment,
-                monthly_income=monthly_income
-            )
+        result = assess_pressure_tool.execute_sync(
+            monthly_payment=monthly_payment,
+            monthly_income=monthly_income
         )
         
         assert result["level"] == "low", \
-            f"月供占比 {ratio*100:.1f}% 应为低压力，实际为 {result['level']}"
+            f"月供占比 {monthly_payment / monthly_income * 100:.1f}% 应为低压力，实际为 {result['level']}"
         assert result["level_name"] == "低", \
             f"压力等级名称应为 '低'，实际为 {result['level_name']}"
     
-    @given(
-        monthly_income=monthly_income_strategy,
-        ratio=st.floats(min_value=0.31, max_value=0.50, allow_nan=False, allow_infinity=False)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_medium_pressure_level(self, monthly_income, ratio):
+    @given(payment_income=payment_income_pair(3100, 5000))
+    @pressure_pbt
+    def test_medium_pressure_level(self, assess_pressure_tool, payment_income):
         """
         **Feature: agent-core, Property 7: 还款压力等级划分**
         **Validates: Requirements 3.5**
         
         30% < 月供/收入 ≤ 50%：应返回中压力等级
         """
-        monthly_payment = monthly_income * ratio
-        pressure_tool = AssessPressureTool()
+        monthly_payment, monthly_income = payment_income
         
-        result = asyncio.get_event_loop().run_until_complete(
-            pressure_tool.execute(
-                monthly_payment=monthly_payment,
-                monthly_income=monthly_income
-            )
+        result = assess_pressure_tool.execute_sync(
+            monthly_payment=monthly_payment,
+            monthly_income=monthly_income
         )
         
         assert result["level"] == "medium", \
-            f"月供占比 {ratio*100:.1f}% 应为中压力，实际为 {result['level']}"
+            f"月供占比 {monthly_payment / monthly_income * 100:.1f}% 应为中压力，实际为 {result['level']}"
         assert result["level_name"] == "中", \
             f"压力等级名称应为 '中'，实际为 {result['level_name']}"
     
-    @given(
-        monthly_income=monthly_income_strategy,
-        ratio=st.floats(min_value=0.51, max_value=0.99, allow_nan=False, allow_infinity=False)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_high_pressure_level(self, monthly_income, ratio):
+    @given(payment_income=payment_income_pair(5100, 9900))
+    @pressure_pbt
+    def test_high_pressure_level(self, assess_pressure_tool, payment_income):
         """
         **Feature: agent-core, Property 7: 还款压力等级划分**
         **Validates: Requirements 3.5**
         
         月供/收入 > 50%：应返回高压力等级
         """
-        monthly_payment = monthly_income * ratio
-        pressure_tool = AssessPressureTool()
+        monthly_payment, monthly_income = payment_income
         
-        result = asyncio.get_event_loop().run_until_complete(
-            pressure_tool.execute(
-                monthly_payment=monthly_payment,
-                monthly_income=monthly_income
-            )
+        result = assess_pressure_tool.execute_sync(
+            monthly_payment=monthly_payment,
+            monthly_income=monthly_income
         )
         
         assert result["level"] == "high", \
-            f"月供占比 {ratio*100:.1f}% 应为高压力，实际为 {result['level']}"
+            f"月供占比 {monthly_payment / monthly_income * 100:.1f}% 应为高压力，实际为 {result['level']}"
         assert result["level_name"] == "高", \
             f"压力等级名称应为 '高'，实际为 {result['level_name']}"
     
@@ -483,21 +437,17 @@ class TestProperty7PressureAssessment:
         monthly_payment=monthly_payment_strategy,
         monthly_income=monthly_income_strategy
     )
-    @settings(max_examples=100, deadline=None)
-    def test_payment_ratio_calculation(self, monthly_payment, monthly_income):
+    @pressure_pbt
+    def test_payment_ratio_calculation(self, assess_pressure_tool, monthly_payment, monthly_income):
         """
         **Feature: agent-core, Property 7: 还款压力等级划分**
         **Validates: Requirements 3.5**
         
         对于任意月供和收入，月供收入比应正确计算
         """
-        pressure_tool = AssessPressureTool()
-        
-        result = asyncio.get_event_loop().run_until_complete(
-            pressure_tool.execute(
-                monthly_payment=monthly_payment,
-                monthly_income=monthly_income
-            )
+        result = assess_pressure_tool.execute_sync(
+            monthly_payment=monthly_payment,
+            monthly_income=monthly_income
         )
         
         expected_ratio = (monthly_payment / monthly_income) * 100
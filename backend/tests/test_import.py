@@ -2,27 +2,27 @@
 from app.agent.intent import IntentRecognizer, ExecutionPlan, ExecutionNode
 from app.agent.engine import AgentEngine
 
-print("导入成功")
 
-# 测试 ExecutionPlan
-plan = ExecutionPlan(
-    nodes=[
-        ExecutionNode(role_id="policy_expert", depends_on=[]),
-        ExecutionNode(role_id="financial_advisor", depends_on=[]),
-        ExecutionNode(role_id="purchase_consultant", depends_on=["policy_expert", "financial_advisor"])
-    ],
-    reason="测试"
-)
-
-print(f"角色: {plan.role_ids}")
-
-# 测试 get_ready_nodes
-completed = set()
-ready = plan.get_ready_nodes(completed)
-print(f"第1轮可执行: {[n.role_id for n in ready]}")
-
-completed = {"policy_expert", "financial_advisor"}
-ready = plan.get_ready_nodes(completed)
-print(f"第2轮可执行: {[n.role_id for n in ready]}")
-
-print("测试通过!")
+def test_imports_and_planning():
+    """测试导入以及 ExecutionPlan 的分轮调度"""
+    assert IntentRecognizer is not None
+    assert AgentEngine is not None
+    
+    # 测试 ExecutionPlan
+    plan = ExecutionPlan(
+        nodes=[
+            ExecutionNode(role_id="policy_expert", depends_on=[]),
+            ExecutionNode(role_id="financial_advisor", depends_on=[]),
+            ExecutionNode(role_id="purchase_consultant", depends_on=["policy_expert", "financial_advisor"])
+        ],
+        reason="测试"
+    )
+    
+    assert plan.role_ids == ["policy_expert", "financial_advisor", "purchase_consultant"]
+    
+    # 测试 get_ready_nodes
+    ready = plan.get_ready_nodes(set())
+    assert [n.role_id for n in ready] == ["policy_expert", "financial_advisor"]
+    
+    ready = plan.get_ready_nodes({"policy_expert", "financial_advisor"})
+    assert [n.role_id for n in ready] == ["purchase_consultant"]
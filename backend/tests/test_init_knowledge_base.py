@@ -0,0 +1,110 @@
+# 知识库同步测试
+# 验证增量同步在 embedding 模型变化时全量重建
+
+import pytest
+
+pytest.importorskip("chromadb")
+
+from app.db.chroma import ChromaClient
+from scripts.init_knowledge_base import sync_documents
+
+
+COLLECTION = ChromaClient.COLLECTION_FAQ
+
+
+class FakeChromaClient:
+    """
+    内存中的 Chroma 客户端替身
+    
+    store 可在多个客户端之间共享，模拟同一个 Chroma 服务；
+    writes 记录每次写入的 (模型, 文档ID列表)
+    """
+    
+    def __init__(self, store: dict, model_id: str):
+        self.store = store
+        self.embedding_model_id = model_id
+        self.writes: list[tuple[str, list[str]]] = []
+    
+    def _get_or_create(self, name: str) -> dict:
+        if name not in self.store:
+            self.store[name] = {
+                "metadata": {ChromaClient.METADATA_EMBEDDING_MODEL: self.embedding_model_id},
+                "docs": {}
+            }
+        return self.store[name]
+    
+    def get_collection_metadata(self, name: str) -> dict | None:
+        collection = self.store.get(name)
+        return None if collection is None else collection["metadata"]
+    
+    def get_metadatas(self, name: str) -> dict[str, dict]:
+        return {doc_id: doc["metadata"] for doc_id, doc in self._get_or_create(name)["docs"].items()}
+    
+    def delete_collection(self, name: str) -> None:
+        self.store.pop(name, None)
+    
+    def delete_documents(self, name: str, ids: list[str]) -> None:
+        for doc_id in ids:
+            self._get_or_create(name)["docs"].pop(doc_id, None)
+    
+    def add_documents(self, collection_name, documents, metadatas, ids, embeddings=None) -> None:
+        docs = self._get_or_create(collection_name)["docs"]
+        for doc_id, metadata in zip(ids, metadatas):
+            docs[doc_id] = {"metadata": metadata, "model": self.embedding_model_id}
+        self.writes.append((self.embedding_model_id, list(ids)))
+    
+    upsert_documents = add_documents
+
+
+def _corpus(n: int = 3) -> tuple[list[str], list[dict], list[str]]:
+    documents = [f"问题：问题{i}\n答案：答案{i}" for i in range(n)]
+    metadatas = [{"type": "faq", "question": f"问题{i}"} for i in range(n)]
+    ids = [f"faq_{i}" for i in range(n)]
+    return documents, metadatas, ids
+
+
+@pytest.mark.asyncio
+async def test_sync_skips_unchanged_documents():
+    """模型不变时，重复同步不重新写入未变化的文档"""
+    store = {}
+    await sync_documents(FakeChromaClient(store, "model-a"), COLLECTION, *_corpus())
+    
+    client = FakeChromaClient(store, "model-a")
+    await sync_documents(client, COLLECTION, *_corpus())
+    
+    assert client.writes == []
+    assert len(store[COLLECTION]["docs"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_rebuilds_when_embedding_model_changes():
+    """embedding 模型变化时重建整个 Collection，所有向量都来自新模型"""
+    store = {}
+    await sync_documents(FakeChromaClient(store, "model-a"), COLLECTION, *_corpus())
+    
+    # 新模型 + 新增一个文档，未变化的旧文档也必须重新计算向量
+    client = FakeChromaClient(store, "model-b")
+    await sync_documents(client, COLLECTION, *_corpus(4))
+    
+    collection = store[COLLECTION]
+    assert collection["metadata"][ChromaClient.METADATA_EMBEDDING_MODEL] == "model-b"
+    assert sorted(collection["docs"]) == ["faq_0", "faq_1", "faq_2", "faq_3"]
+    assert {doc["model"] for doc in collection["docs"].values()} == {"model-b"}
+    assert sorted(doc_id for _, ids in client.writes for doc_id in ids) == sorted(collection["docs"])
+
+
+@pytest.mark.asyncio
+async def test_sync_rebuilds_collection_without_model_record():
+    """旧版本创建、未记录 embedding 模型的 Collection 视为模型不一致，全量重建"""
+    documents, metadatas, ids = _corpus()
+    store = {
+        COLLECTION: {
+            "metadata": {"hnsw:space": "cosine"},
+            "docs": {doc_id: {"metadata": meta, "model": "unknown"} for doc_id, meta in zip(ids, metadatas)}
+        }
+    }
+    
+    await sync_documents(FakeChromaClient(store, "model-a"), COLLECTION, documents, metadatas, ids)
+    
+    assert store[COLLECTION]["metadata"][ChromaClient.METADATA_EMBEDDING_MODEL] == "model-a"
+    assert {doc["model"] for doc in store[COLLECTION]["docs"].values()} == {"model-a"}
@@ -1,34 +1,55 @@
 # 集成测试 - API 端点测试
 # 任务 15: 最终检查点 - 集成测试
 
+import uuid
+
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 
 
-@pytest.fixture
-def client():
-    """创建测试客户端"""
-    with TestClient(app) as c:
-        yield c
+# 贷款计算请求体（模块级共享，测试中只读）
+LOAN_PAYLOAD = {
+    "price": 1000000,
+    "down_payment_ratio": 0.3,
+    "years": 30,
+    "rate": 4.2
+}
+EQUAL_PAYMENT_PAYLOAD = {**LOAN_PAYLOAD, "method": "equal_payment"}
+EQUAL_PRINCIPAL_PAYLOAD = {**LOAN_PAYLOAD, "method": "equal_principal"}
+ZERO_RATE_PAYLOAD = {**EQUAL_PAYMENT_PAYLOAD, "rate": 0}
+INVALID_PRICE_PAYLOAD = {**LOAN_PAYLOAD, "price": -1000}  # 无效价格
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient():
+    """
+    创建异步测试客户端（整个会话共享，lifespan 只执行一次）
+    
+    直接通过 ASGITransport 在当前事件循环中调用应用，不经过 TestClient 的线程切换
+    """
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            yield c
 
 
 class TestHealthAPI:
     """健康检查 API 测试"""
     
-    def test_root_endpoint(self, client):
+    async def test_root_endpoint(self, aclient):
         """测试根路径"""
-        response = client.get("/")
+        response = await aclient.get("/")
         assert response.status_code == 200
         data = response.json()
         assert data["code"] == 0
         assert "data" in data
         assert data["data"]["name"] == "购房决策智能助手"
     
-    def test_health_endpoint(self, client):
+    async def test_health_endpoint(self, aclient):
         """测试健康检查端点"""
-        response = client.get("/api/v1/health")
+        response = await aclient.get("/api/v1/health")
         assert response.status_code == 200
         data = response.json()
         assert data["code"] == 0
@@ -38,15 +59,9 @@ class TestHealthAPI:
 class TestCalculatorLoanAPI:
     """贷款计算 API 测试"""
     
-    def test_calc_loan_equal_payment(self, client):
+    async def test_calc_loan_equal_payment(self, aclient):
         """测试等额本息贷款计算"""
-        response = client.post("/api/v1/calc/loan", json={
-            "price": 1000000,
-            "down_payment_ratio": 0.3,
-            "years": 30,
-            "rate": 4.2,
-            "method": "equal_payment"
-        })
+        response = await aclient.post("/api/v1/calc/loan", json=EQUAL_PAYMENT_PAYLOAD)
         assert response.status_code == 200
         data = response.json()
         assert data["code"] == 0
@@ -60,15 +75,9 @@ class TestCalculatorLoanAPI:
         assert result["total_interest"] > 0
         assert result["method"] == "equal_payment"
     
-    def test_calc_loan_equal_principal(self, client):
+    async def test_calc_loan_equal_principal(self, aclient):
         """测试等额本金贷款计算"""
-        response = client.post("/api/v1/calc/loan", json={
-            "price": 1000000,
-            "down_payment_ratio": 0.3,
-            "years": 30,
-            "rate": 4.2,
-            "method": "equal_principal"
-        })
+        response = await aclient.post("/api/v1/calc/loan", json=EQUAL_PRINCIPAL_PAYLOAD)
         assert response.status_code == 200
         data = response.json()
         assert data["code"] == 0
@@ -77,15 +86,9 @@ class TestCalculatorLoanAPI:
         assert result["method"] == "equal_principal"
         assert result["first_month_payment"] > result["last_month_payment"]
     
-    def test_calc_loan_zero_rate(self, client):
+    async def test_calc_loan_zero_rate(self, aclient):
         """测试零利率贷款计算"""
-        response = client.post("/api/v1/calc/loan", json={
-            "price": 1000000,
-            "down_payment_ratio": 0.3,
-            "years": 30,
-            "rate": 0,
-            "method": "equal_payment"
-        })
+        response = await aclient.post("/api/v1/calc/loan", json=ZERO_RATE_PAYLOAD)
         assert response.status_code == 200
         data = response.json()
         assert data["code"] == 0
@@ -96,14 +99,9 @@ class TestCalculatorLoanAPI:
         expected_monthly = 700000 / 360
         assert abs(result["monthly_payment"] - expected_monthly) < 0.01
     
-    def test_calc_loan_validation_error(self, client):
+    async def test_calc_loan_validation_error(self, aclient):
         """测试参数验证错误"""
-        response = client.post("/api/v1/calc/loan", json={
-            "price": -1000,  # 无效价格
-            "down_payment_ratio": 0.3,
-            "years": 30,
-            "rate": 4.2
-        })
+        response = await aclient.post("/api/v1/calc/loan", json=INVALID_PRICE_PAYLOAD)
         assert response.status_code == 422
         data = response.json()
         assert data["code"] == 3001
@@ -113,9 +111,9 @@ class TestCalculatorLoanAPI:
 class TestCalculatorTaxAPI:
     """税费计算 API 测试"""
     
-    def test_calc_tax_first_home_small(self, client):
+    async def test_calc_tax_first_home_small(self, aclient):
         """测试首套小面积房税费"""
-        response = client.post("/api/v1/calc/tax", json={
+        response = await aclient.post("/api/v1/calc/tax", json={
             "price": 1000000,
             "area": 85,
             "is_first_home": True,
@@ -133,9 +131,9 @@ class TestCalculatorTaxAPI:
         assert result["vat"] == 0
         assert result["vat_exempt"] is True
     
-    def test_calc_tax_second_home_large(self, client):
+    async def test_calc_tax_second_home_large(self, aclient):
         """测试二套大面积房税费"""
-        response = client.post("/api/v1/calc/tax", json={
+        response = await aclient.post("/api/v1/calc/tax", json={
             "price": 2000000,
             "area": 120,
             "is_first_home": False,
@@ -156,9 +154,9 @@ class TestCalculatorTaxAPI:
 class TestCalculatorTotalCostAPI:
     """总成本计算 API 测试"""
     
-    def test_calc_total_cost(self, client):
+    async def test_calc_total_cost(self, aclient):
         """测试总成本计算"""
-        response = client.post("/api/v1/calc/total_cost", json={
+        response = await aclient.post("/api/v1/calc/total_cost", json={
             "price": 1000000,
             "down_payment": 300000,
             "total_interest": 500000,
@@ -184,11 +182,11 @@ class TestCalculatorTotalCostAPI:
 class TestChatAPI:
     """对话 API 测试"""
     
-    def test_chat_endpoint_exists(self, client):
+    async def test_chat_endpoint_exists(self, aclient):
         """测试对话端点存在"""
-        # 发送一个简单请求，验证端点存在
-        response = client.post("/api/v1/chat", json={
-            "session_id": "test-session-001",
+        # 发送一个简单请求，验证端点存在（独立会话 ID，避免与其他测试共享会话状态）
+        response = await aclient.post("/api/v1/chat", json={
+            "session_id": f"test-session-{uuid.uuid4().hex}",
             "message": "你好",
             "mode": "standard"
         })
@@ -196,32 +194,32 @@ class TestChatAPI:
         assert response.status_code == 200
         assert response.headers.get("content-type") == "text/event-stream; charset=utf-8"
     
-    def test_chat_invalid_mode(self, client):
+    async def test_chat_invalid_mode(self, aclient):
         """测试无效的 mode 参数"""
-        response = client.post("/api/v1/chat", json={
+        response = await aclient.post("/api/v1/chat", json={
             "session_id": "test-session-001",
             "message": "你好",
             "mode": "invalid_mode"
         })
         assert response.status_code == 400
     
-    def test_chat_missing_session_id(self, client):
+    async def test_chat_missing_session_id(self, aclient):
         """测试缺少 session_id"""
-        response = client.post("/api/v1/chat", json={
+        response = await aclient.post("/api/v1/chat", json={
             "message": "你好"
         })
         assert response.status_code == 422
     
-    def test_chat_missing_message(self, client):
+    async def test_chat_missing_message(self, aclient):
         """测试缺少 message"""
-        response = client.post("/api/v1/chat", json={
+        response = await aclient.post("/api/v1/chat", json={
             "session_id": "test-session-001"
         })
         assert response.status_code == 422
     
-    def test_clear_session(self, client):
+    async def test_clear_session(self, aclient):
         """测试清除会话"""
-        response = client.delete("/api/v1/chat/test-session-001")
+        response = await aclient.delete(f"/api/v1/chat/test-session-{uuid.uuid4().hex}")
         assert response.status_code == 200
         data = response.json()
         assert data["code"] == 0
@@ -230,14 +228,9 @@ class TestChatAPI:
 class TestAPIResponseFormat:
     """API 响应格式一致性测试"""
     
-    def test_success_response_has_required_fields(self, client):
+    async def test_success_response_has_required_fields(self, aclient):
         """测试成功响应包含必需字段"""
-        response = client.post("/api/v1/calc/loan", json={
-            "price": 1000000,
-            "down_payment_ratio": 0.3,
-            "years": 30,
-            "rate": 4.2
-        })
+        response = await aclient.post("/api/v1/calc/loan", json=LOAN_PAYLOAD)
         data = response.json()
         
         # 验证响应格式
@@ -247,14 +240,9 @@ class TestAPIResponseFormat:
         assert data["code"] == 0
         assert data["message"] == "success"
     
-    def test_error_response_has_required_fields(self, client):
+    async def test_error_response_has_required_fields(self, aclient):
         """测试错误响应包含必需字段"""
-        response = client.post("/api/v1/calc/loan", json={
-            "price": -1000,  # 无效
-            "down_payment_ratio": 0.3,
-            "years": 30,
-            "rate": 4.2
-        })
+        response = await aclient.post("/api/v1/calc/loan", json=INVALID_PRICE_PAYLOAD)
         data = response.json()
         
         # 验证响应格式
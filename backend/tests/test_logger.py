@@ -0,0 +1,40 @@
+# 日志模块测试
+# 验证日志线程停止后可以重新启动，停止后的日志不会滞留在队列中
+
+import logging
+
+from app.utils import logger as logger_module
+from app.utils.logger import setup_logging, shutdown_logging
+
+
+def test_setup_after_shutdown_restarts_listener(tmp_path, monkeypatch):
+    """shutdown_logging 移除队列 handler，再次 setup_logging 重新启动后台线程"""
+    monkeypatch.setattr(logger_module, "LOG_DIR", tmp_path)
+    name = "house_advisor.test_restart"
+    
+    logger = setup_logging(name=name)
+    logger.info("第一次生命周期")
+    shutdown_logging(name)
+    assert logger.handlers == []
+    
+    logger = setup_logging(name=name)
+    assert len(logger.handlers) == 1
+    logger.info("第二次生命周期")
+    shutdown_logging(name)
+    
+    content = (tmp_path / "app.log").read_text(encoding="utf-8")
+    assert "第一次生命周期" in content
+    assert "第二次生命周期" in content
+
+
+def test_shutdown_by_name_keeps_other_loggers(tmp_path, monkeypatch):
+    """按名称停止时不影响其它 logger 的日志线程"""
+    monkeypatch.setattr(logger_module, "LOG_DIR", tmp_path)
+    
+    kept = setup_logging(name="house_advisor.test_kept")
+    setup_logging(name="house_advisor.test_stopped")
+    shutdown_logging("house_advisor.test_stopped")
+    
+    assert logging.getLogger("house_advisor.test_stopped").handlers == []
+    assert len(kept.handlers) == 1
+    shutdown_logging("house_advisor.test_kept")
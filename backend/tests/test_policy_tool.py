@@ -1,8 +1,6 @@
 # 政策检索工具测试脚本
 import asyncio
-import sys
 import pytest
-sys.path.insert(0, '.')
 
 from app.agent.tools.policy import get_knowledge_base, SearchPolicyTool, SearchFAQTool
 
@@ -126,5 +124,6 @@ async def main():
     print("所有测试完成!")
     print("=" * 50)
 
+# 单独运行：在 backend 目录下执行 python -m tests.test_policy_tool
 if __name__ == "__main__":
     asyncio.run(main())
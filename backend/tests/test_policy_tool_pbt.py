@@ -3,14 +3,9 @@
 # 验证: 需求 5.4
 
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, settings
 
-from app.agent.tools.policy import (
-    PolicyKnowledgeBase,
-    SearchPolicyTool,
-    SearchFAQTool,
-    get_knowledge_base
-)
+from app.agent.tools.policy import get_knowledge_base
 
 
 # ============================================================
@@ -53,18 +48,17 @@ top_k_strategy = st.integers(min_value=1, max_value=10)
 class TestPolicyCityFilter:
     """Property 8: 政策检索城市过滤"""
     
-    @pytest.fixture(autouse=True)
-    def setup_knowledge_base(self):
-        """确保知识库已加载"""
-        self.kb = get_knowledge_base()
-        yield
+    @pytest.fixture(scope="class", autouse=True)
+    def setup_knowledge_base(self, request):
+        """确保知识库已加载（每个测试类只获取一次）"""
+        request.cls.kb = get_knowledge_base()
     
     @given(
         city=city_strategy,
         query=search_query_strategy,
         top_k=top_k_strategy
     )
-    @settings(max_examples=100, deadline=None)
+    @settings(max_examples=100)
     def test_policy_search_city_filter(self, city: str, query: str, top_k: int):
         """
         **Feature: agent-core, Property 8: 政策检索城市过滤**
@@ -88,7 +82,7 @@ class TestPolicyCityFilter:
         query=search_query_strategy,
         top_k=top_k_strategy
     )
-    @settings(max_examples=100, deadline=None)
+    @settings(max_examples=100)
     def test_faq_search_city_filter(self, city: str, query: str, top_k: int):
         """
         **Feature: agent-core, Property 8: 政策检索城市过滤**
@@ -111,19 +105,17 @@ class TestPolicyCityFilter:
         city=city_strategy,
         query=search_query_strategy
     )
-    @settings(max_examples=100, deadline=None)
+    @settings(max_examples=100)
     @pytest.mark.asyncio
-    async def test_search_policy_tool_city_filter(self, city: str, query: str):
+    async def test_search_policy_tool_city_filter(self, search_policy_tool, city: str, query: str):
         """
         **Feature: agent-core, Property 8: 政策检索城市过滤**
         **Validates: Requirements 5.4**
         
         对于任意带城市参数的 SearchPolicyTool 调用，返回结果中所有文档的城市字段应与查询城市匹配
         """
-        tool = SearchPolicyTool()
-        
         # 执行工具调用
-        result = await tool.execute(query=query, city=city)
+        result = await search_policy_tool.execute(query=query, city=city)
         
         # 验证调用成功
         assert result["success"] is True, "工具调用应成功"
@@ -140,19 +132,17 @@ class TestPolicyCityFilter:
         city=city_strategy,
         query=search_query_strategy
     )
-    @settings(max_examples=100, deadline=None)
+    @settings(max_examples=100)
     @pytest.mark.asyncio
-    async def test_search_faq_tool_city_filter(self, city: str, query: str):
+    async def test_search_faq_tool_city_filter(self, search_faq_tool, city: str, query: str):
         """
         **Feature: agent-core, Property 8: 政策检索城市过滤**
         **Validates: Requirements 5.4**
         
         对于任意带城市参数的 SearchFAQTool 调用，返回结果中所有文档的城市字段应与查询城市匹配
         """
-        tool = SearchFAQTool()
-        
         # 执行工具调用
-        result = await tool.execute(query=query, city=city)
+        result = await search_faq_tool.execute(query=query, city=city)
         
         # 验证调用成功
         assert result["success"] is True, "工具调用应成功"
@@ -169,7 +159,7 @@ class TestPolicyCityFilter:
         query=search_query_strategy,
         top_k=top_k_strategy
     )
-    @settings(max_examples=100, deadline=None)
+    @settings(max_examples=100)
     def test_policy_search_without_city_returns_all(self, query: str, top_k: int):
         """
         **Feature: agent-core, Property 8: 政策检索城市过滤**
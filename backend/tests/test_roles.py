@@ -1,7 +1,6 @@
 # 角色系统测试
 # 验证角色定义和工具列表完整性
 
-import pytest
 from app.agent.roles import (
     Role,
     FINANCIAL_ADVISOR,
@@ -17,11 +16,7 @@ from app.agent.roles import (
 )
 # 从 __init__.py 导入以触发工具注册
 from app.agent.tools import (
-    tool_registry,
-    CalcLoanTool,
-    CalcTaxTool,
-    QueryMarketTool,
-    SearchPolicyTool
+    tool_registry
 )
 
 
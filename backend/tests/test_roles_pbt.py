@@ -2,26 +2,16 @@
 # Property 9: 角色工具列表完整性
 # 验证: 需求 6.5
 
-import pytest
 from hypothesis import given, strategies as st, settings
 
 from app.agent.roles import (
     Role,
     ALL_ROLES,
-    get_role,
-    get_all_roles,
-    FINANCIAL_ADVISOR,
-    POLICY_EXPERT,
-    MARKET_ANALYST,
-    PURCHASE_CONSULTANT
+    get_role
 )
 # 从 __init__.py 导入以触发工具注册
 from app.agent.tools import (
-    tool_registry,
-    CalcLoanTool,
-    CalcTaxTool,
-    QueryMarketTool,
-    SearchPolicyTool
+    tool_registry
 )
 
 
@@ -46,7 +36,7 @@ class TestRoleToolsIntegrityPBT:
     """Property 9: 角色工具列表完整性 - 属性测试"""
     
     @given(role=role_strategy)
-    @settings(max_examples=100, deadline=None)
+    @settings(max_examples=100)
     def test_role_tools_list_non_empty(self, role: Role):
         """
         **Feature: agent-core, Property 9: 角色工具列表完整性**
@@ -58,7 +48,7 @@ class TestRoleToolsIntegrityPBT:
         assert len(role.tools) > 0, f"角色 {role.name} 的 tools 列表不应为空"
     
     @given(role=role_strategy)
-    @settings(max_examples=100, deadline=None)
+    @settings(max_examples=100)
     def test_role_tools_all_registered(self, role: Role):
         """
         **Feature: agent-core, Property 9: 角色工具列表完整性**
@@ -71,7 +61,7 @@ class TestRoleToolsIntegrityPBT:
                 f"角色 {role.name} 的工具 '{tool_name}' 未在 Tool_Registry 中注册"
     
     @given(role=role_strategy)
-    @settings(max_examples=100, deadline=None)
+    @settings(max_examples=100)
     def test_role_tools_retrievable(self, role: Role):
         """
         **Feature: agent-core, Property 9: 角色工具列表完整性**
@@ -87,7 +77,7 @@ class TestRoleToolsIntegrityPBT:
                 f"检索到的工具名称 '{tool.name}' 与请求的名称 '{tool_name}' 不一致"
     
     @given(role_id=role_id_strategy)
-    @settings(max_examples=100, deadline=None)
+    @settings(max_examples=100)
     def test_role_by_id_tools_integrity(self, role_id: str):
         """
         **Feature: agent-core, Property 9: 角色工具列表完整性**
@@ -107,7 +97,7 @@ class TestRoleToolsIntegrityPBT:
                 f"角色 {role.name} 的工具 '{tool_name}' 未在 Tool_Registry 中注册"
     
     @given(role=role_strategy)
-    @settings(max_examples=100, deadline=None)
+    @settings(max_examples=100)
     def test_role_tools_can_generate_schema(self, role: Role):
         """
         **Feature: agent-core, Property 9: 角色工具列表完整性**
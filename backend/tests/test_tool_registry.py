@@ -1,22 +1,19 @@
 # 测试工具注册表
-import sys
-sys.path.insert(0, '.')
 
-from app.agent.tools import tool_registry
+import pytest
 
-print("已注册的工具:")
-for tool in tool_registry.get_all():
-    print(f"  - {tool.name}: {tool.description[:50]}...")
 
-print(f"\n总计: {len(tool_registry.get_all())} 个工具")
+@pytest.mark.parametrize("name", ["search_policy", "search_faq"])
+def test_tool_registered(registry, name: str):
+    """政策工具应已注册，且按名称检索得到同名工具"""
+    assert registry.exists(name), f"{name} 工具未注册"
+    assert registry.get(name).name == name
 
-# 检查政策工具是否注册
-if tool_registry.exists("search_policy"):
-    print("\n✓ search_policy 工具已注册")
-else:
-    print("\n✗ search_policy 工具未注册")
 
-if tool_registry.exists("search_faq"):
-    print("✓ search_faq 工具已注册")
-else:
-    print("✗ search_faq 工具未注册")
+def test_registered_tools_have_description(registry):
+    """所有已注册的工具都应有名称和描述"""
+    tools = registry.get_all()
+    assert len(tools) == len(registry) > 0
+    for tool in tools:
+        assert tool.name, "工具名称不应为空"
+        assert tool.description, f"工具 {tool.name} 缺少描述"